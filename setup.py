@@ -1,42 +0,0 @@
-"""Setup script for the ATG package."""
-from setuptools import setup, find_packages
-
-setup(
-    name="atg",
-    version="0.1.0",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    python_requires=">=3.8",
-    install_requires=[
-        "markdown>=3.3.0",
-        "python-docx>=0.8.11",
-        "PyPDF2>=2.0.0",
-    ],
-    extras_require={
-        "dev": [
-            "black>=22.0.0",
-            "flake8>=4.0.0",
-            "isort>=5.10.0",
-            "mypy>=0.910",
-            "pytest>=7.0.0",
-            "pytest-cov>=3.0.0",
-            "pytest-mock>=3.10.0",
-        ],
-    },
-    author="Abraham Ra",
-    author_email="gramos112@gmail.com",
-    description="Automated Test Generator - AI-powered test generation from documentation",
-    long_description=open("README.md", encoding="utf-8").read(),
-    long_description_content_type="text/markdown",
-    url="https://github.com/AbrahamRa/ATG",
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-    ],
-)
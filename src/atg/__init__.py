@@ -2,8 +2,6 @@
 
 This package provides tools for automatically generating test cases from documentation.
 """
-from importlib.metadata import version
-
 __version__ = "0.1.0"
 __author__ = "Abraham Ra"
 __email__ = "gramos112@gmail.com"
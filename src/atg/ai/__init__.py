@@ -6,6 +6,10 @@ from typing import List, Dict, Any, Optional
 
 __all__ = ["TestGenerator"]
 
+# OpenAI clients shared by all generators, keyed by API key, so repeated
+# initialization reuses the same HTTP connection pool
+_clients: Dict[Optional[str], Any] = {}
+
 
 class TestGenerator:
     """A class for generating test cases using AI models."""
@@ -27,10 +31,15 @@ class TestGenerator:
         Args:
             api_key: The API key for the AI service. If None, will look for OPENAI_API_KEY environment variable.
         """
+        client = _clients.get(api_key)
+        if client is not None:
+            self._client = client
+            return
+
         try:
             from openai import OpenAI
 
-            self._client = OpenAI(api_key=api_key)
+            self._client = _clients[api_key] = OpenAI(api_key=api_key)
         except ImportError:
             raise ImportError(
                 "The 'openai' package is required for AI test generation. "
@@ -38,24 +47,31 @@ class TestGenerator:
             )
 
     def generate_test_cases(
-        self, requirements: str, test_framework: str = "pytest"
+        self,
+        requirements: str,
+        test_framework: str = "pytest",
+        client: Optional[Any] = None,
     ) -> List[Dict[str, Any]]:
         """Generate test cases based on the provided requirements.
 
         Args:
             requirements: The requirements or documentation to generate tests from.
             test_framework: The testing framework to generate tests for (e.g., 'pytest', 'unittest').
+            client: Optional pre-built OpenAI client to use instead of this
+                generator's own client.
 
         Returns:
             A list of dictionaries containing test case information.
         """
-        if not self._client:
-            self.initialize()
+        if client is None:
+            if not self._client:
+                self.initialize()
+            client = self._client
 
         prompt = self._build_prompt(requirements, test_framework)
 
         try:
-            response = self._client.chat.completions.create(
+            response = client.chat.completions.create(
                 model=self.model_name,
                 messages=[
                     {
@@ -74,6 +90,27 @@ class TestGenerator:
         except Exception as e:
             raise RuntimeError(f"Failed to generate test cases: {str(e)}")
 
+    def embed(
+        self, texts: List[str], model: str = "text-embedding-3-small"
+    ) -> List[List[float]]:
+        """Compute embedding vectors for the given texts.
+
+        Args:
+            texts: The texts to embed.
+            model: The name of the embedding model to use.
+
+        Returns:
+            One embedding vector per text, in the same order.
+        """
+        if not self._client:
+            self.initialize()
+
+        try:
+            response = self._client.embeddings.create(model=model, input=texts)
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            raise RuntimeError(f"Failed to create embeddings: {str(e)}")
+
     def _build_prompt(self, requirements: str, test_framework: str) -> str:
         """Build the prompt for the AI model.
 
@@ -1,25 +1,62 @@
 """Configuration management for ATG."""
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Default configuration
+_DEFAULTS: Dict[str, Any] = {
+    "openai_api_key": None,
+    "model_name": "gpt-4",
+    "temperature": 0.7,
+    "test_framework": "pytest",
+    "output_dir": "tests/generated",
+    "keyword_library_path": None,  # Will be set by user or tests
+    "disable_rule_table": False,  # Map common verbs without the AI model
+    "keyword_rules": None,  # Extra verb -> keyword rules
+    "semantic_cache": False,  # Match paraphrased actions by embedding (numpy)
+    "semantic_threshold": 0.92,
+    "embedding_model": "text-embedding-3-small",
+}
+
+# Optional environment overrides: config key -> (variable name, converter)
+_ENV_OVERRIDES: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "model_name": ("ATG_MODEL_NAME", str),
+    "temperature": ("ATG_TEMPERATURE", float),
+    "test_framework": ("ATG_TEST_FRAMEWORK", str),
+}
+
+
+def _read_env() -> Dict[str, Any]:
+    """Read the configuration values provided by environment variables.
+
+    Returns:
+        Mapping of configuration keys to their values from the environment.
+        The API key is always present; other keys only when set and valid.
+    """
+    environ = os.environ
+    values: Dict[str, Any] = {"openai_api_key": environ.get("OPENAI_API_KEY")}
+    for key, (var, convert) in _ENV_OVERRIDES.items():
+        raw = environ.get(var)
+        if raw:
+            try:
+                values[key] = convert(raw)
+            except (ValueError, TypeError):
+                pass
+    return values
+
+
+# Snapshot of the environment taken once at import time
+_ENV = _read_env()
 
 
 class Config:
     """Configuration manager for ATG."""
 
     def __init__(self):
-        """Initialize the configuration with default values."""
-        # Default configuration
-        self._config = {
-            "openai_api_key": os.environ.get("OPENAI_API_KEY"),
-            "model_name": "gpt-4",
-            "temperature": 0.7,
-            "test_framework": "pytest",
-            "output_dir": "tests/generated",
-            "keyword_library_path": None,  # Will be set by user or tests
-        }
-
-    def get(self, key: str, default=None) -> any:
+        """Initialize the configuration with defaults and environment overrides."""
+        self._config = {**_DEFAULTS, **_ENV}
+
+    def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
 
         Args:
@@ -29,12 +66,9 @@ class Config:
         Returns:
             The configuration value or default if not found.
         """
-        value = self._config.get(key, default)
-        if key == "keyword_library_path":
-            return value
-        return value
+        return self._config.get(key, default)
 
-    def set(self, key: str, value: any) -> None:
+    def set(self, key: str, value: Any) -> None:
         """Set a configuration value.
 
         Args:
@@ -47,21 +81,18 @@ class Config:
                 value = str(value)
         self._config[key] = value
 
-    def load_from_env(self) -> None:
-        """Load configuration from environment variables."""
-        self._config["openai_api_key"] = os.environ.get("OPENAI_API_KEY")
+    def load_from_env(self, reload: bool = False) -> None:
+        """Load configuration from environment variables.
 
-        if model_name := os.environ.get("ATG_MODEL_NAME"):
-            self._config["model_name"] = model_name
+        The environment is snapshotted once at import time and applied by
+        ``__init__``, so this is a no-op unless ``reload`` is set. Call it
+        with ``reload=True`` to pick up variables changed after import.
 
-        if temp := os.environ.get("ATG_TEMPERATURE"):
-            try:
-                self._config["temperature"] = float(temp)
-            except (ValueError, TypeError):
-                pass
-
-        if framework := os.environ.get("ATG_TEST_FRAMEWORK"):
-            self._config["test_framework"] = framework
+        Args:
+            reload: Re-read the environment instead of using the snapshot.
+        """
+        if reload:
+            self._config.update(_read_env())
 
     def validate(self) -> bool:
         """Validate the current configuration.
@@ -82,8 +113,14 @@ class Config:
         return self._config.get("_validation_disabled", False)
 
 
-# Global configuration instance
-config = Config()
+def __getattr__(name: str) -> Any:
+    """Create the global configuration instance on first access (PEP 562).
 
-# Load configuration from environment variables on import
-config.load_from_env()
+    ``from atg.config import config`` builds the instance the first time and
+    caches it as a module global, so later lookups don't come back here.
+    Environment overrides are already applied by ``Config.__init__``.
+    """
+    if name == "config":
+        instance = globals()["config"] = Config()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,28 +3,24 @@
 This module provides functionality to ingest and parse various document formats
 into a structured format for test generation.
 """
+import os
 from pathlib import Path
-from typing import Dict, Optional, Protocol, Type, Union, TypeVar
+from typing import Any, Optional, Protocol, Union, TypeVar
 
+from atg.ingestion import parsers
 from atg.ingestion.parsers import (
+    PARSERS,
+    SUPPORTED_EXTENSIONS,
     BaseParser,
-    DocxParser,
-    MarkdownParser,
-    PdfParser,
-    TextParser,
+    get_parser,
+    load_parser,
 )
 
 # Type variable for document parsers
 T = TypeVar("T", bound="BaseParser")
 
-# Map file extensions to their respective parser classes
-PARSERS: Dict[str, Type[BaseParser]] = {
-    ".txt": TextParser,
-    ".md": MarkdownParser,
-    ".markdown": MarkdownParser,
-    ".docx": DocxParser,
-    ".pdf": PdfParser,
-}
+# Parser classes re-exported lazily through __getattr__
+_LAZY_PARSERS = ("DocxParser", "MarkdownParser", "PdfParser", "TextParser")
 
 
 class DocumentParser(Protocol):
@@ -45,24 +41,20 @@ class DocumentParser(Protocol):
         ...
 
 
-def get_parser(file_path: Union[str, Path]) -> Type[BaseParser]:
-    """Get the appropriate parser class for the given file.
+def _get_parser_instance(file_path: Union[str, Path]) -> Optional[BaseParser]:
+    """Get the parser for a file without normalizing the path.
 
     Args:
-        file_path: Path to the file to parse.
+        file_path: Path to the file to parse, used as given.
 
     Returns:
-        The parser class for the file type.
-
-    Raises:
-        ValueError: If no parser is available for the file type.
+        The shared instance of the appropriate parser, or None if no parser
+        is available.
     """
-    file_path = Path(file_path)
-    ext = file_path.suffix.lower()
-    if ext not in PARSERS:
-        raise ValueError(f"No parser available for file type: {ext}")
-
-    return PARSERS[ext]
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
+        return None
+    return load_parser(ext)
 
 
 def get_parser_for_file(file_path: Union[str, Path]) -> Optional[BaseParser]:
@@ -74,11 +66,7 @@ def get_parser_for_file(file_path: Union[str, Path]) -> Optional[BaseParser]:
     Returns:
         An instance of the appropriate parser, or None if no parser is available.
     """
-    try:
-        parser_class = get_parser(file_path)
-        return parser_class()
-    except ValueError:
-        return None
+    return _get_parser_instance(file_path)
 
 
 def parse_document(file_path: Union[str, Path]) -> str:
@@ -94,18 +82,31 @@ def parse_document(file_path: Union[str, Path]) -> str:
         FileNotFoundError: If the file does not exist.
         ValueError: If no parser is available for the file type.
     """
-    file_path = Path(file_path)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    parser = get_parser_for_file(file_path)
+    parser = _get_parser_instance(file_path)
     if not parser:
         raise ValueError(f"No parser available for file: {file_path}")
 
     return parser.parse(file_path)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve the parser classes on first access (PEP 562).
+
+    The parser backends are only imported when one of their classes is
+    actually used, so importing this package stays cheap.
+    """
+    if name in _LAZY_PARSERS:
+        return getattr(parsers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    "PARSERS",
     "BaseParser",
     "DocxParser",
     "MarkdownParser",
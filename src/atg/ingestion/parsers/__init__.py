@@ -2,28 +2,35 @@
 
 This module contains parsers for different document formats.
 """
+import abc
+import functools
+import importlib
+import os
 from pathlib import Path
-from typing import Optional, Protocol, runtime_checkable, Type, Dict, TypeVar
+from typing import Any, Dict, Tuple, Type, TypeVar, Union
 
 T = TypeVar("T", bound="BaseParser")
 
 
-@runtime_checkable
-class BaseParser(Protocol):
-    """Base interface for all document parsers.
+class BaseParser(abc.ABC):
+    """Base class for all document parsers.
 
     All document parsers must implement this interface.
     """
 
+    # File extensions handled by the parser (including the dot, e.g. '.txt')
+    SUPPORTED_FORMATS: Tuple[str, ...] = ()
+
     @classmethod
-    def supported_formats(cls) -> tuple[str, ...]:
+    def supported_formats(cls) -> Tuple[str, ...]:
         """Get the file extensions supported by this parser.
 
         Returns:
             A tuple of supported file extensions (including the dot, e.g. '.txt').
         """
-        ...
+        return cls.SUPPORTED_FORMATS
 
+    @abc.abstractmethod
     def parse(self, file_path: Path) -> str:
         """Parse the document and return its content as a string.
 
@@ -45,38 +52,84 @@ class BaseParser(Protocol):
         Returns:
             True if this parser can parse the file, False otherwise.
         """
-        return file_path.suffix.lower() in cls.supported_formats()
-
-
-# Import all parser implementations
-from .text_parser import TextParser
-from .markdown_parser import MarkdownParser
-from .docx_parser import DocxParser
-from .pdf_parser import PdfParser
-
-# Map of file extensions to their respective parser classes
-PARSERS: Dict[str, Type[BaseParser]] = {
-    ".txt": TextParser,
-    ".md": MarkdownParser,
-    ".markdown": MarkdownParser,
-    ".docx": DocxParser,
-    ".pdf": PdfParser,
+        return file_path.suffix.lower() in cls.SUPPORTED_FORMATS
+
+
+# Map of file extensions to the (module, class name) of their parser. Parser
+# modules pull in heavy third-party backends (docx, markdown, pypdfium2), so they
+# are only imported the first time a parser for that extension is requested.
+PARSERS: Dict[str, Tuple[str, str]] = {
+    ".txt": ("atg.ingestion.parsers.text_parser", "TextParser"),
+    ".md": ("atg.ingestion.parsers.markdown_parser", "MarkdownParser"),
+    ".markdown": ("atg.ingestion.parsers.markdown_parser", "MarkdownParser"),
+    ".docx": ("atg.ingestion.parsers.docx_parser", "DocxParser"),
+    ".pdf": ("atg.ingestion.parsers.pdf_parser", "PdfParser"),
 }
 
+# Extensions with a registered parser, for cheap membership checks
+SUPPORTED_EXTENSIONS = frozenset(PARSERS)
+
+
+@functools.lru_cache(maxsize=16)
+def load_parser_class(ext: str) -> Type[BaseParser]:
+    """Import and return the parser class registered for an extension.
+
+    Args:
+        ext: Lower-cased file extension, including the dot (e.g. '.txt').
+
+    Returns:
+        The parser class for the extension.
+
+    Raises:
+        ValueError: If no parser is available for the file type.
+    """
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"No parser available for file type: {ext}")
+    mod_name, cls_name = PARSERS[ext]
+    return getattr(importlib.import_module(mod_name), cls_name)
+
+
+@functools.lru_cache(maxsize=16)
+def load_parser(ext: str) -> BaseParser:
+    """Get the shared parser instance registered for an extension.
 
-def get_parser(file_path: Path) -> BaseParser:
+    Parsers built with default options hold no per-file state, so one
+    instance per extension serves every file.
+
+    Args:
+        ext: Lower-cased file extension, including the dot (e.g. '.txt').
+
+    Returns:
+        The parser instance for the extension.
+
+    Raises:
+        ValueError: If no parser is available for the file type.
+    """
+    return load_parser_class(ext)()
+
+
+def get_parser(file_path: Union[str, Path]) -> BaseParser:
     """Get the appropriate parser for the given file.
 
     Args:
         file_path: Path to the file to parse.
 
     Returns:
-        An instance of the appropriate parser.
+        The shared instance of the appropriate parser.
 
     Raises:
         ValueError: If no parser is available for the file type.
     """
-    ext = file_path.suffix.lower()
-    if ext not in PARSERS:
-        raise ValueError(f"No parser available for file type: {ext}")
-    return PARSERS[ext]()
+    return load_parser(os.path.splitext(file_path)[1].lower())
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve parser classes on first access (PEP 562).
+
+    Keeps ``from atg.ingestion.parsers import PdfParser`` working without
+    importing every backend when the package itself is imported.
+    """
+    for mod_name, cls_name in PARSERS.values():
+        if cls_name == name:
+            return getattr(importlib.import_module(mod_name), cls_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
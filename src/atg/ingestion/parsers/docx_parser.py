@@ -1,75 +1,392 @@
 """DOCX file parser for ATG."""
+import io
+import posixpath
+import zipfile
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import docx
+from lxml import etree
 
 from . import BaseParser
 
+# WordprocessingML element and attribute names used by the fast path
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P, _TBL, _TR, _TC = _W + "p", _W + "tbl", _W + "tr", _W + "tc"
+_R, _HYPERLINK, _BR, _VAL = _W + "r", _W + "hyperlink", _W + "br", _W + "val"
+
+# Text of the run content elements python-docx includes in run text; w:t
+# holds its own text, and w:br depends on the break type
+_RUN_TEXT = {
+    _W + "t": None,
+    _W + "tab": "\t",
+    _W + "ptab": "\t",
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+    _BR: None,
+}
+
+# Elements whose direct w:p children python-docx reads as paragraphs
+_BODY = _W + "body"
+_HEADER_FOOTER = {_W + "hdr", _W + "ftr"}
+
+# Section properties, and the references to their header and footer parts
+_SECT_PR, _PPR = _W + "sectPr", _W + "pPr"
+_HEADER_REF, _FOOTER_REF = _W + "headerReference", _W + "footerReference"
+_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+# Relationships of the main document part, which locate headers and footers
+_DOCUMENT_RELS = "word/_rels/document.xml.rels"
+_RELATIONSHIP = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+
+
+def _paragraph_text(paragraph: etree._Element) -> str:
+    """Get the text of a ``w:p`` element the way python-docx renders it.
+
+    Only runs directly in the paragraph or in its hyperlinks count. Line
+    breaks become newlines; page and column breaks add no text.
+
+    Args:
+        paragraph: The paragraph element.
+
+    Returns:
+        The paragraph text.
+    """
+    parts = []
+    for child in paragraph.iterchildren(_R, _HYPERLINK):
+        runs = (child,) if child.tag == _R else child.iterchildren(_R)
+        for run in runs:
+            for el in run.iterchildren(*_RUN_TEXT):
+                text = _RUN_TEXT[el.tag]
+                if text is not None:
+                    parts.append(text)
+                elif el.tag == _BR:
+                    if el.get(_W + "type", "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                else:
+                    parts.append(el.text or "")
+    return "".join(parts)
+
+
+def _property_val(
+    element: etree._Element, properties: str, name: str
+) -> Optional[str]:
+    """Get the ``w:val`` of a property of a table row or cell.
+
+    Args:
+        element: The ``w:tr`` or ``w:tc`` element.
+        properties: Tag of its properties element (``trPr`` or ``tcPr``).
+        name: Tag of the property element.
+
+    Returns:
+        The property value, "" if the property has no value, or None if the
+        property is not set.
+    """
+    prop = element.find(f"{_W}{properties}/{_W}{name}")
+    if prop is None:
+        return None
+    value: str = prop.get(_VAL, "")
+    return value
+
+
+def _table_text(table: etree._Element) -> str:
+    """Get the text of a ``w:tbl`` element the way python-docx renders it.
+
+    Each row is one line of its non-empty cells. Like python-docx, a cell
+    spanning several grid columns is repeated for each of them, and a cell
+    continuing a vertical merge repeats the text of the cell it continues.
+
+    Args:
+        table: The table element.
+
+    Returns:
+        The table text.
+    """
+    rows = []
+    above: Dict[int, str] = {}  # grid column -> text of the cell there
+    for row in table.iterchildren(_TR):
+        texts: List[str] = []
+        current: Dict[int, str] = {}
+        column = int(_property_val(row, "trPr", "gridBefore") or 0)
+        for cell in row.iterchildren(_TC):
+            span = int(_property_val(cell, "tcPr", "gridSpan") or 1)
+            if _property_val(cell, "tcPr", "vMerge") in ("", "continue"):
+                text = above.get(column, "")
+            else:
+                text = "\n".join(_paragraph_text(p) for p in cell.iterchildren(_P))
+            current[column] = text
+            texts.extend([text] * span)
+            column += span
+        above = current
+        rows.append(" | ".join(t for t in (text.strip() for text in texts) if t))
+    return "\n".join(rows)
+
+
+def _release(element: etree._Element) -> None:
+    """Free a processed element and the processed siblings before it.
+
+    Clearing alone leaves the empty element attached to its parent, so the
+    tree would still grow with the document.
+
+    Args:
+        element: The element that has been read.
+    """
+    element.clear()
+    parent = element.getparent()
+    while element.getprevious() is not None:
+        del parent[0]
+
 
 class DocxParser(BaseParser):
     """Parser for Microsoft Word documents (.docx)."""
 
-    @classmethod
-    def supported_formats(cls) -> tuple[str, ...]:
-        """Get the file extensions supported by this parser.
+    SUPPORTED_FORMATS = (".docx",)
 
-        Returns:
-            A tuple of supported file extensions.
+    def __init__(self, fast: bool = True):
+        """Initialize the parser.
+
+        Args:
+            fast: Stream the document XML straight out of the DOCX package
+                instead of building the python-docx object model. Falls back
+                to python-docx if the fast path fails.
         """
-        return (".docx",)
+        self.fast = fast
 
-    def _get_paragraphs_text(self, paragraphs: List) -> List[str]:
-        """Extract text from a list of paragraphs.
+    def _get_paragraphs_text(self, paragraphs: Iterable) -> Iterator[str]:
+        """Iterate over the text of each non-empty paragraph.
 
         Args:
-            paragraphs: List of paragraph objects from python-docx.
+            paragraphs: Paragraph objects from python-docx.
 
         Returns:
-            List of paragraph texts.
+            Iterator of paragraph texts.
         """
-        return [p.text for p in paragraphs if p.text.strip()]
+        # python-docx rebuilds p.text from the runs on every access
+        return (text for text in (p.text for p in paragraphs) if text.strip())
+
+    def _get_tables_text(self, tables: Iterable) -> Iterator[str]:
+        """Iterate over the text of each table, one row per line.
 
-    def _get_tables_text(self, tables: List) -> List[str]:
-        """Extract text from tables.
+        Empty cells are skipped.
 
         Args:
-            tables: List of table objects from python-docx.
+            tables: Table objects from python-docx.
 
         Returns:
-            List of table texts.
+            Iterator of table texts.
         """
-        table_texts = []
-        for table in tables:
-            rows_text = []
-            for row in table.rows:
-                row_text = []
-                for cell in row.cells:
-                    row_text.append(cell.text.strip())
-                rows_text.append(" | ".join(row_text))
-            if rows_text:
-                table_texts.append("\n".join(rows_text))
-        return table_texts
-
-    def _get_header_footer_text(self, doc) -> List[str]:
-        """Extract text from headers and footers.
+        return (
+            "\n".join(
+                " | ".join(text for text in (c.text.strip() for c in row.cells) if text)
+                for row in table.rows
+            )
+            for table in tables
+            if table.rows
+        )
+
+    def _get_header_footer_text(self, doc: Any) -> Iterator[str]:
+        """Yield the text of headers and footers.
 
         Args:
             doc: The document object from python-docx.
 
-        Returns:
-            List of header and footer texts.
+        Yields:
+            Header and footer texts.
         """
-        texts = []
         for section in doc.sections:
             # Get header text
             if section.header is not None:
-                texts.extend(self._get_paragraphs_text(section.header.paragraphs))
+                yield from self._get_paragraphs_text(section.header.paragraphs)
             # Get footer text
             if section.footer is not None:
-                texts.extend(self._get_paragraphs_text(section.footer.paragraphs))
+                yield from self._get_paragraphs_text(section.footer.paragraphs)
+
+    def _iter_body(
+        self, source: IO[bytes]
+    ) -> Tuple[List[str], List[str], List[Tuple[Optional[str], Optional[str]]]]:
+        """Stream paragraphs and tables out of a ``word/document.xml`` file.
+
+        Args:
+            source: File object for the document XML.
+
+        Returns:
+            Tuple of (non-empty body paragraph texts, table texts, section
+            references), with the relationship ids of each section's default
+            header and footer, or None where the section has none of its own.
+        """
+        paragraphs: List[str] = []
+        tables: List[str] = []
+        sections: List[Tuple[Optional[str], Optional[str]]] = []
+
+        for _, el in etree.iterparse(source, tag=(_P, _TBL, _SECT_PR)):
+            parent = el.getparent()
+            if el.tag == _SECT_PR:
+                # Sections end at a body paragraph's properties, or at the body
+                if parent.tag == _BODY or (
+                    parent.tag == _PPR
+                    and parent.getparent().getparent().tag == _BODY
+                ):
+                    sections.append(
+                        (
+                            self._default_reference(el, _HEADER_REF),
+                            self._default_reference(el, _FOOTER_REF),
+                        )
+                    )
+                continue
+            # Paragraphs and tables nested in other elements are read with
+            # the table containing them, or skipped like python-docx does
+            if parent.tag != _BODY:
+                continue
+            if el.tag == _P:
+                text = _paragraph_text(el)
+                if text.strip():
+                    paragraphs.append(text)
+            elif el.find(_TR) is not None:
+                tables.append(_table_text(el))
+            _release(el)
+
+        return paragraphs, tables, sections
+
+    @staticmethod
+    def _default_reference(sect_pr: etree._Element, tag: str) -> Optional[str]:
+        """Get the relationship id of a section's default header or footer.
+
+        Args:
+            sect_pr: The ``w:sectPr`` element of the section.
+            tag: ``w:headerReference`` or ``w:footerReference``.
+
+        Returns:
+            The relationship id, or None if the section has no default one.
+        """
+        for reference in sect_pr.iterchildren(tag):
+            if reference.get(_W + "type") == "default":
+                rel_id: Optional[str] = reference.get(_REL_ID)
+                return rel_id
+        return None
+
+    def _header_footer_parts(
+        self,
+        package: zipfile.ZipFile,
+        sections: List[Tuple[Optional[str], Optional[str]]],
+    ) -> List[str]:
+        """Get the header and footer parts python-docx reads, in its order.
+
+        Like ``section.header`` and ``section.footer``, each section uses its
+        default header and footer, or the previous section's when it has none
+        of its own, and the header comes before the footer.
+
+        Args:
+            package: The open DOCX package.
+            sections: Header and footer relationship ids of each section.
+
+        Returns:
+            Names of the header and footer parts, repeated where sections
+            share them.
+        """
+        targets: Dict[str, str] = {}
+        if _DOCUMENT_RELS in package.namelist():
+            with package.open(_DOCUMENT_RELS) as source:
+                for rel in etree.parse(source).getroot().iterchildren(_RELATIONSHIP):
+                    target = rel.get("Target", "")
+                    if target.startswith("/"):
+                        targets[rel.get("Id")] = target[1:]
+                    else:
+                        targets[rel.get("Id")] = posixpath.normpath(
+                            posixpath.join("word", target)
+                        )
+
+        names: List[str] = []
+        header: Optional[str] = None
+        footer: Optional[str] = None
+        for header_id, footer_id in sections:
+            header = header_id or header
+            footer = footer_id or footer
+            names.extend(targets[rid] for rid in (header, footer) if rid)
+        return names
+
+    def _parse_fast(self, file_path: Path) -> str:
+        """Extract text by streaming the XML parts of the DOCX package.
+
+        Args:
+            file_path: Path to the DOCX file to parse.
+
+        Returns:
+            The parsed content as plain text.
+        """
+        with zipfile.ZipFile(file_path) as package:
+            with package.open("word/document.xml") as source:
+                paragraphs, tables, sections = self._iter_body(source)
+
+            # Parts shared by several sections are read once
+            part_texts: Dict[str, List[str]] = {}
+            headers_footers = []
+            for name in self._header_footer_parts(package, sections):
+                if name not in part_texts:
+                    part_texts[name] = self._header_footer_text(package, name)
+                headers_footers.extend(part_texts[name])
+
+        return self._join_parts(paragraphs, tables, headers_footers)
+
+    @staticmethod
+    def _header_footer_text(package: zipfile.ZipFile, name: str) -> List[str]:
+        """Get the non-empty paragraph texts of a header or footer part.
+
+        Args:
+            package: The open DOCX package.
+            name: Name of the header or footer part.
+
+        Returns:
+            The paragraph texts.
+        """
+        texts = []
+        with package.open(name) as source:
+            for _, el in etree.iterparse(source, tag=_P):
+                if el.getparent().tag not in _HEADER_FOOTER:
+                    continue
+                text = _paragraph_text(el)
+                if text.strip():
+                    texts.append(text)
+                _release(el)
         return texts
 
+    def _join_parts(
+        self,
+        paragraphs: Iterable[str],
+        tables: Iterable[str],
+        headers_footers: Iterable[str],
+    ) -> str:
+        """Join the text of each part of a document into one string.
+
+        Args:
+            paragraphs: Body paragraph texts.
+            tables: Table texts.
+            headers_footers: Header and footer texts.
+
+        Returns:
+            The combined content.
+        """
+        # (heading, separator, texts) for each part of the document
+        parts = (
+            ("", "\n\n", paragraphs),
+            ("\n\nTables:\n", "\n\n", tables),
+            ("\n\nHeaders/Footers:\n", "\n", headers_footers),
+        )
+
+        # Write each text straight into the output buffer as it is produced
+        buf = io.StringIO()
+        for heading, separator, texts in parts:
+            for i, text in enumerate(texts):
+                if i:
+                    buf.write(separator)
+                else:
+                    if buf.tell():
+                        buf.write("\n\n")
+                    buf.write(heading)
+                buf.write(text)
+
+        return buf.getvalue()
+
     def parse(self, file_path: Path) -> str:
         """Parse a DOCX file and return its content as plain text.
 
@@ -84,27 +401,29 @@ class DocxParser(BaseParser):
             PermissionError: If the file cannot be accessed.
             ValueError: If there's an error parsing the document.
         """
+        if self.fast:
+            try:
+                return self._parse_fast(file_path)
+            except Exception:
+                # Fall back to the full python-docx object model
+                pass
+
+        # python-docx is only needed here, so importing it is deferred until
+        # a document doesn't go through the fast path
+        import docx
+        from docx.opc.exceptions import PackageNotFoundError
+
         try:
             # Load the document
-            doc = docx.Document(file_path)
-
-            # Extract content from different parts of the document
-            paragraphs = self._get_paragraphs_text(doc.paragraphs)
-            tables = self._get_tables_text(doc.tables)
-            headers_footers = self._get_header_footer_text(doc)
-
-            # Combine all content
-            content_parts = []
-            if paragraphs:
-                content_parts.append("\n\n".join(paragraphs))
-            if tables:
-                content_parts.append("\n\nTables:\n" + "\n\n".join(tables))
-            if headers_footers:
-                content_parts.append(
-                    "\n\nHeaders/Footers:\n" + "\n".join(headers_footers)
-                )
-
-            return "\n\n".join(content_parts)
+            doc = docx.Document(str(file_path))
+
+            return self._join_parts(
+                self._get_paragraphs_text(doc.paragraphs),
+                self._get_tables_text(doc.tables),
+                self._get_header_footer_text(doc),
+            )
 
+        except (PackageNotFoundError, PermissionError):
+            raise
         except Exception as e:
-            raise ValueError(f"Error parsing DOCX file {file_path}: {str(e)}")
+            raise ValueError(f"Error parsing DOCX file {file_path}") from e
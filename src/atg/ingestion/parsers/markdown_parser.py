@@ -1,53 +1,51 @@
 """Markdown file parser for ATG."""
+import threading
 from pathlib import Path
-from typing import Optional, cast
+from typing import Sequence, Tuple
 
 import markdown
-from markdown.extensions import Extension
-from markdown.treeprocessors import Treeprocessor
 
 from . import BaseParser
 
+# Markdown instances are expensive to build and not thread-safe, so each
+# thread keeps one per extension set and resets it after every document.
+_local = threading.local()
 
-class MarkdownExtractor(Treeprocessor):
-    """Custom Markdown processor to extract text content."""
 
-    def run(self, root):
-        """Process the markdown tree and return plain text content.
+def _get_markdown(extensions: Tuple[str, ...] = ()) -> markdown.Markdown:
+    """Get this thread's cached Markdown converter for a set of extensions.
 
-        Args:
-            root: The root element of the markdown tree.
-
-        Returns:
-            The root element (modified in place).
-        """
-        # This processor doesn't modify the tree, just returns it
-        return root
+    Args:
+        extensions: Names of the Markdown extensions to enable.
 
-
-class MarkdownExtension(Extension):
-    """Markdown extension to customize the parsing process."""
-
-    def extendMarkdown(self, md):
-        """Register the extractor with the markdown instance.
-
-        Args:
-            md: The markdown instance to extend.
-        """
-        md.treeprocessors.register(MarkdownExtractor(md), "atg_extractor", 0)
+    Returns:
+        A Markdown instance ready to convert a new document.
+    """
+    converters = getattr(_local, "converters", None)
+    if converters is None:
+        converters = _local.converters = {}
+    md = converters.get(extensions)
+    if md is None:
+        md = converters[extensions] = markdown.Markdown(
+            extensions=list(extensions), output_format="html", tab_length=4
+        )
+    return md
 
 
 class MarkdownParser(BaseParser):
     """Parser for Markdown files (.md, .markdown)."""
 
-    @classmethod
-    def supported_formats(cls) -> tuple[str, ...]:
-        """Get the file extensions supported by this parser.
+    SUPPORTED_FORMATS = (".md", ".markdown")
 
-        Returns:
-            A tuple of supported file extensions.
+    def __init__(self, extensions: Sequence[str] = ()):
+        """Initialize the parser.
+
+        Args:
+            extensions: Names of Markdown extensions to enable (e.g. 'tables').
+                Each distinct set gets its own cached converter; the default
+                converter loads no extensions.
         """
-        return (".md", ".markdown")
+        self.extensions = tuple(extensions)
 
     def parse(self, file_path: Path) -> str:
         """Parse a Markdown file and return its content as plain text.
@@ -65,11 +63,12 @@ class MarkdownParser(BaseParser):
         # Read the file content
         content = file_path.read_text(encoding="utf-8")
 
-        # Configure markdown with our custom extension
-        md = markdown.Markdown(extensions=[MarkdownExtension()])
-
-        # Convert markdown to HTML
-        html = md.convert(content)
+        # Convert markdown to HTML, leaving the converter clean for the next file
+        md = _get_markdown(self.extensions)
+        try:
+            html = md.convert(content)
+        finally:
+            md.reset()
 
         # For now, we'll return the raw HTML, but we might want to convert it to plain text
         # or process it further based on our needs
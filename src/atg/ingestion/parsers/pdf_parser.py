@@ -1,59 +1,73 @@
 """PDF file parser for ATG."""
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator
 
-from PyPDF2 import PdfReader
+import pypdfium2 as pdfium
 
 from . import BaseParser
 
+# Document information entries included in the output, in order
+_META_KEYS = ("Title", "Author", "Subject", "Keywords")
+
+# PDFium is not thread-safe, so documents are parsed one at a time
+_PDFIUM_LOCK = threading.Lock()
+
 
 class PdfParser(BaseParser):
     """Parser for PDF documents (.pdf)."""
 
-    @classmethod
-    def supported_formats(cls) -> tuple[str, ...]:
-        """Get the file extensions supported by this parser.
+    SUPPORTED_FORMATS = (".pdf",)
 
-        Returns:
-            A tuple of supported file extensions.
-        """
-        return (".pdf",)
-
-    def _extract_text_from_page(self, page) -> str:
+    def _extract_text_from_page(self, page: pdfium.PdfPage) -> str:
         """Extract text from a single PDF page.
 
         Args:
-            page: A page object from PyPDF2.
+            page: A page object from pypdfium2.
 
         Returns:
             Extracted text from the page.
         """
         try:
-            return page.extract_text() or ""
+            textpage = page.get_textpage()
+            try:
+                # PDFium separates lines with CRLF
+                text: str = textpage.get_text_range()
+                return text.replace("\r\n", "\n")
+            finally:
+                textpage.close()
         except Exception as e:
             print(f"Warning: Could not extract text from page: {e}")
             return ""
 
-    def _extract_metadata(self, reader) -> str:
+    def _iter_pages_text(self, pdf: pdfium.PdfDocument) -> Iterator[str]:
+        """Yield the labelled text of each non-empty page, one page at a time.
+
+        Args:
+            pdf: The pypdfium2 document object.
+
+        Yields:
+            Page texts prefixed with their page number.
+        """
+        for page_num, page in enumerate(pdf, 1):
+            try:
+                page_text = self._extract_text_from_page(page)
+            finally:
+                page.close()
+            if page_text.strip():
+                yield f"--- Page {page_num} ---\n{page_text}"
+
+    def _extract_metadata(self, pdf: pdfium.PdfDocument) -> str:
         """Extract metadata from the PDF.
 
         Args:
-            reader: The PDF reader object.
+            pdf: The pypdfium2 document object.
 
         Returns:
             Formatted metadata as a string.
         """
-        metadata = []
-        if info := reader.metadata:
-            if title := info.get("/Title"):
-                metadata.append(f"Title: {title}")
-            if author := info.get("/Author"):
-                metadata.append(f"Author: {author}")
-            if subject := info.get("/Subject"):
-                metadata.append(f"Subject: {subject}")
-            if keywords := info.get("/Keywords"):
-                metadata.append(f"Keywords: {keywords}")
-        return "\n".join(metadata) if metadata else ""
+        info = pdf.get_metadata_dict() or {}
+        return "\n".join(f"{key}: {info[key]}" for key in _META_KEYS if info.get(key))
 
     def parse(self, file_path: Path) -> str:
         """Parse a PDF file and return its content as plain text.
@@ -73,27 +87,25 @@ class PdfParser(BaseParser):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
-            with open(file_path, "rb") as file:
-                reader = PdfReader(file)
-
-                # Extract metadata
-                metadata = self._extract_metadata(reader)
-
-                # Extract text from each page
-                pages_text = []
-                for page_num, page in enumerate(reader.pages, 1):
-                    page_text = self._extract_text_from_page(page)
-                    if page_text.strip():
-                        pages_text.append(f"--- Page {page_num} ---\n{page_text}")
-
-                # Combine metadata and content
-                content_parts = []
-                if metadata:
-                    content_parts.append(f"--- Document Metadata ---\n{metadata}")
-                if pages_text:
-                    content_parts.append("\n\n".join(pages_text))
-
-                return "\n\n".join(content_parts)
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(str(file_path))
+                try:
+                    # Extract metadata
+                    metadata = self._extract_metadata(pdf)
+
+                    # Extract text from each page
+                    pages_text = "\n\n".join(self._iter_pages_text(pdf))
+                finally:
+                    pdf.close()
+
+            # Combine metadata and content
+            content_parts = []
+            if metadata:
+                content_parts.append(f"--- Document Metadata ---\n{metadata}")
+            if pages_text:
+                content_parts.append(pages_text)
+
+            return "\n\n".join(content_parts)
 
         except Exception as e:
-            raise ValueError(f"Error parsing PDF file {file_path}: {str(e)}")
+            raise ValueError(f"Error parsing PDF file {file_path}") from e
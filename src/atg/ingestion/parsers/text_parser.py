@@ -1,20 +1,41 @@
 """Text file parser for ATG."""
+import mmap
+import os
 from pathlib import Path
 
 from . import BaseParser
 
+# Files at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Chunk size for reading files whose size is unknown or changes while reading
+_READ_CHUNK = 64 * 1024
+
 
 class TextParser(BaseParser):
     """Parser for plain text files (.txt)."""
 
-    @classmethod
-    def supported_formats(cls) -> tuple[str, ...]:
-        """Get the file extensions supported by this parser.
+    SUPPORTED_FORMATS = (".txt",)
+
+    def _read_bytes(self, fd: int, size: int) -> bytes:
+        """Read the whole file behind a descriptor, normally in one call.
+
+        Args:
+            fd: Open file descriptor positioned at the start of the file.
+            size: Size of the file as reported by ``os.fstat``.
 
         Returns:
-            A tuple of supported file extensions.
+            The file content.
         """
-        return (".txt",)
+        data = os.read(fd, size)
+        if size and len(data) == size:
+            return data
+
+        # Short read, or a file that doesn't report its size (e.g. a pipe)
+        chunks = [data]
+        while chunk := os.read(fd, _READ_CHUNK):
+            chunks.append(chunk)
+        return b"".join(chunks)
 
     def parse(self, file_path: Path) -> str:
         """Parse a text file and return its content.
@@ -28,4 +49,18 @@ class TextParser(BaseParser):
         Raises:
             UnicodeDecodeError: If the file cannot be decoded as UTF-8.
         """
-        return file_path.read_text(encoding="utf-8")
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            size = os.fstat(fd).st_size
+            if size >= _MMAP_THRESHOLD:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    text = str(mapped, "utf-8")
+            else:
+                text = self._read_bytes(fd, size).decode("utf-8")
+        finally:
+            os.close(fd)
+
+        # Translate newlines like text-mode reads do
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
@@ -3,14 +3,165 @@
 This module provides functionality to map extracted actions from documentation
 to appropriate Robot Framework keywords.
 """
+import ast
+import functools
+import re
+import stat
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 import os
 import json
+import sqlite3
+import tempfile
 
 from atg.config import Config
 from atg.ai import TestGenerator
 
+# Optional faster JSON backend
+orjson: Any
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Maximum number of AI lookup results remembered per mapper
+_ACTION_CACHE_SIZE = 1024
+
+# Maximum number of texts sent in one embeddings request
+_EMBED_BATCH_SIZE = 256
+
+# Seconds semantic matching is paused after a failure, doubling with each
+# further failure up to the maximum
+_SEMANTIC_RETRY_DELAY = 30.0
+_SEMANTIC_MAX_RETRY_DELAY = 3600.0
+
+# Library files with these suffixes are stored in SQLite instead of JSON
+_SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Markdown code fences models often wrap their JSON answers in
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.M)
+
+# Robot Framework keywords for actions starting with a common verb; these
+# are mapped directly without asking the AI model. Verbs whose keyword
+# depends on the rest of the action (open, close, type, enter, check,
+# select, ...) are left to the model.
+_DEFAULT_KEYWORD_RULES = {
+    "click": "Click Element",
+    "navigate": "Go To",
+}
+
+# Fixed parts of the keyword suggestion prompts; the actions go in between
+_KEYWORD_PROMPT_PREFIX = (
+    "You are a Robot Framework test case generator.\n"
+    'Given the action: "'
+)
+_KEYWORD_PROMPT_SUFFIX = (
+    '"\n'
+    "Suggest the most appropriate Robot Framework keyword.\n"
+    "Return a JSON object with the following structure:\n"
+    '{"keyword": "KeywordName", "confidence": 0.0 to 1.0}\n'
+)
+_BATCH_PROMPT_PREFIX = (
+    "You are a Robot Framework test case generator.\n"
+    "For each of the following actions, suggest the most appropriate\n"
+    "Robot Framework keyword:\n"
+)
+_BATCH_PROMPT_SUFFIX = (
+    "\nReturn a JSON array with one object per action, in the same order,\n"
+    "each with the following structure:\n"
+    '{"keyword": "KeywordName", "confidence": 0.0 to 1.0}\n'
+)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        # Non-string keys are written as strings, like the json module does
+        data: bytes = orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        return data
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=4096)
+def _leading_verb(action: str) -> str:
+    """Get the casefolded first word of an action, or "" if it has none.
+
+    Args:
+        action: The action extracted from documentation
+
+    Returns:
+        The normalized leading verb
+    """
+    words = action.split(maxsplit=1)
+    return words[0].casefold() if words else ""
+
+
+def _parse_model_json(content: str) -> Any:
+    """Parse the JSON in an AI model response, tolerating code fences.
+
+    Python literal syntax (single quotes, ``True``, ``None``) is accepted as
+    a second chance when the content is not strict JSON.
+
+    Raises:
+        ValueError: If the content is neither JSON nor a Python literal.
+    """
+    text = _CODE_FENCE_RE.sub("", content.strip())
+    try:
+        return _json_loads(text)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError) as e:
+        raise ValueError("Response is not valid JSON") from e
+
+
+def _import_numpy() -> Any:
+    """Import NumPy, which is only needed for semantic keyword matching.
+
+    Returns:
+        The numpy module.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+
+        return numpy
+    except ImportError:
+        raise ImportError(
+            "The 'numpy' package is required for semantic keyword matching. "
+            "Please install it with: pip install numpy"
+        )
+
 
 class KeywordMapper:
     """Maps extracted actions to Robot Framework keywords."""
@@ -24,26 +175,65 @@ class KeywordMapper:
         self.config = config
         self.keyword_library = {}
         self.unmapped_keywords: Set[str] = set()
+        self._generator: Optional[TestGenerator] = None
+        # Unsaved library changes, and whether saving is deferred by a batch
+        self._dirty = False
+        self._buffered = False
+        self._changed: Set[str] = set()
+        self._db: Optional[sqlite3.Connection] = None
+        # Results of AI lookups, including failed ones, in LRU order
+        self._action_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = (
+            OrderedDict()
+        )
+        # Guards the caches when actions are mapped from several threads
+        self._lock = threading.RLock()
 
         # Initialize min_confidence from config
         self.min_confidence = self.config.get("min_confidence", 0.8)
 
-        # Load library if path is set
+        # Verb -> keyword rules answered without the AI model
+        if self.config.get("disable_rule_table", False):
+            self._rule_table: Dict[str, str] = {}
+        else:
+            self._rule_table = {
+                **_DEFAULT_KEYWORD_RULES,
+                **(self.config.get("keyword_rules") or {}),
+            }
+
+        # Optional semantic matching of paraphrased actions by embedding
+        self._semantic = bool(self.config.get("semantic_cache", False))
+        self._semantic_threshold = float(self.config.get("semantic_threshold", 0.92))
+        self._embeddings: Dict[str, Any] = {}  # action -> unit-length vector
+        self._emb_actions: List[str] = []  # action for each matrix row
+        self._emb_matrix: Any = None  # numpy matrix of the indexed vectors
+        # Consecutive semantic matching failures, and when to try again
+        self._semantic_failures = 0
+        self._semantic_retry_at = 0.0
+        if self._semantic:
+            _import_numpy()
+
+        # Resolve the library path once, creating its directory up front
         library_path = self.config.get("keyword_library_path")
-        if library_path:
+        self._library_path = Path(library_path) if library_path else None
+        if self._library_path is not None:
+            self._library_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Load library if path is set
             self._load_keyword_library()
 
     def _load_keyword_library(self):
         """Load the keyword library from resource files."""
-        library_path = self.config.get("keyword_library_path")
+        library_path = self._library_path
         if library_path:
-            library_path = Path(library_path)
-            # Ensure parent directory exists
-            library_path.parent.mkdir(parents=True, exist_ok=True)
             try:
-                if library_path.exists():
-                    with open(library_path, "r", encoding="utf-8") as f:
-                        self.keyword_library = json.load(f)
+                if library_path.suffix.lower() in _SQLITE_SUFFIXES:
+                    self.keyword_library = self._load_sqlite_library(library_path)
+                    if self._semantic:
+                        self._load_embeddings(library_path)
+                elif library_path.exists():
+                    self.keyword_library = _json_loads(library_path.read_bytes())
+                    if self._semantic:
+                        self._load_embeddings(library_path)
                 else:
                     # Initialize empty library
                     self.keyword_library = {}
@@ -54,118 +244,604 @@ class KeywordMapper:
             # Initialize empty library
             self.keyword_library = {}
 
+    def _load_sqlite_library(self, library_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Open a SQLite keyword library and read all of its entries.
+
+        Args:
+            library_path: Path of the SQLite database, created if missing
+
+        Returns:
+            The library entries, keyed by action
+        """
+        # Every write goes through _mark_dirty or batch_updates under
+        # self._lock, so the connection can be shared between threads
+        self._db = sqlite3.connect(
+            str(library_path), isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS kw (action TEXT PRIMARY KEY, "
+            "keyword TEXT NOT NULL, confidence REAL NOT NULL)"
+        )
+        return {
+            action: {"keyword": keyword, "confidence": confidence}
+            for action, keyword, confidence in self._db.execute(
+                "SELECT action, keyword, confidence FROM kw"
+            )
+        }
+
+    def _save_sqlite_library(self) -> None:
+        """Write changed library entries to the SQLite database in one transaction.
+
+        Only the actions recorded by ``_mark_dirty`` are written; without any,
+        every entry is written.
+        """
+        db = self._db
+        assert db is not None
+        actions = self._changed or self.keyword_library.keys()
+        rows = []
+        for action in actions:
+            entry = self.keyword_library[action]
+            rows.append((action, entry["keyword"], entry["confidence"]))
+        db.execute("BEGIN")
+        try:
+            db.executemany("INSERT OR REPLACE INTO kw VALUES (?, ?, ?)", rows)
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+        self._changed.clear()
+
     def _save_keyword_library(self):
         """Save the updated keyword library."""
-        library_path = self.config.get("keyword_library_path")
+        library_path = self._library_path
         if not library_path:
             return False
 
-        library_path = Path(library_path)
-        # Ensure parent directory exists
-        library_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._db is not None:
+            try:
+                self._save_sqlite_library()
+                if self._semantic:
+                    self._save_embeddings(library_path)
+                return True
+            except Exception as e:
+                print(f"Warning: Failed to save keyword library: {e}")
+                return False
+
         try:
-            # Create a temporary copy of the library to save
-            temp_library = self.keyword_library.copy()
-            with open(library_path, "w", encoding="utf-8") as f:
-                json.dump(temp_library, f, indent=2)
+            # Serialize in memory first: one write, and a serialization error
+            # can't leave a truncated library behind
+            data = _json_dumps(self.keyword_library)
+
+            # The temporary file is created private (0600); the library keeps
+            # its current permissions, or gets the default ones when new
+            created = False
+            try:
+                mode = stat.S_IMODE(os.stat(library_path).st_mode)
+            except FileNotFoundError:
+                # Create the library so the kernel applies the umask
+                os.close(os.open(library_path, os.O_CREAT | os.O_WRONLY, 0o666))
+                created = True
+                mode = stat.S_IMODE(os.stat(library_path).st_mode)
+
+            # Write a temporary file and swap it in, so a crash mid-write
+            # never leaves a corrupt library that would load as empty
+            with tempfile.NamedTemporaryFile(
+                mode="wb",
+                dir=library_path.parent,
+                prefix=f".{library_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                try:
+                    tmp.write(data)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                    os.chmod(tmp.name, mode)
+                except BaseException:
+                    tmp.close()
+                    os.unlink(tmp.name)
+                    if created:
+                        os.unlink(library_path)
+                    raise
+            os.replace(tmp.name, library_path)
+            self._changed.clear()
+            if self._semantic:
+                self._save_embeddings(library_path)
             return True
         except Exception as e:
             print(f"Warning: Failed to save keyword library: {e}")
             return False
 
-    def map_action_to_keyword(self, action: str) -> Tuple[Optional[str], float]:
-        """Map an action to the most appropriate Robot Framework keyword.
+    def _mark_dirty(self, *actions: str) -> bool:
+        """Record a library change, saving it now unless updates are batched.
 
         Args:
-            action: The action extracted from documentation
+            *actions: The actions whose library entries changed
 
         Returns:
-            Tuple containing (keyword, confidence) or (None, 0) if no match
+            True if the change was saved or deferred, False if saving failed
         """
-        # Check if action is already in library
-        if action in self.keyword_library:
-            return (
-                self.keyword_library[action]["keyword"],
-                self.keyword_library[action]["confidence"],
+        with self._lock:
+            self._changed.update(actions)
+            self._dirty = True
+            if self._buffered:
+                return True
+            if self._save_keyword_library():
+                self._dirty = False
+                return True
+            return False
+
+    @contextmanager
+    def batch_updates(self) -> Iterator["KeywordMapper"]:
+        """Defer saving library changes until the end of the block.
+
+        The library is written once on exit if anything changed, instead of
+        after every new mapping. Nested blocks save with the outermost one.
+
+        Yields:
+            This keyword mapper
+        """
+        if self._buffered:
+            yield self
+            return
+
+        self._buffered = True
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._buffered = False
+                if self._dirty and self._save_keyword_library():
+                    self._dirty = False
+
+    def close(self) -> None:
+        """Save pending library changes and close the SQLite connection, if any."""
+        with self._lock:
+            if self._dirty and self._save_keyword_library():
+                self._dirty = False
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @staticmethod
+    def _embeddings_path(library_path: Path) -> Path:
+        """Get the file the embeddings are persisted in next to the library."""
+        return library_path.with_suffix(".embeddings.npz")
+
+    def _load_embeddings(self, library_path: Path) -> None:
+        """Load the persisted embeddings of the library's actions.
+
+        Args:
+            library_path: Path of the keyword library JSON file
+        """
+        path = self._embeddings_path(library_path)
+        if not path.exists():
+            return
+        np = _import_numpy()
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                self._embeddings = {
+                    action: vector
+                    for action, vector in zip(data["actions"].tolist(), data["vectors"])
+                    if action in self.keyword_library
+                }
+        except Exception as e:
+            print(f"Warning: Failed to load keyword embeddings: {e}")
+            self._embeddings = {}
+
+    def _save_embeddings(self, library_path: Path) -> None:
+        """Persist the embeddings of the library's actions.
+
+        Args:
+            library_path: Path of the keyword library JSON file
+        """
+        actions = [a for a in self.keyword_library if a in self._embeddings]
+        if not actions:
+            return
+        np = _import_numpy()
+        with open(self._embeddings_path(library_path), "wb") as f:
+            np.savez(
+                f,
+                actions=np.array(actions),
+                vectors=np.stack([self._embeddings[a] for a in actions]),
             )
 
-        # Use AI to suggest best keyword match
+    def _embed(self, texts: List[str]) -> Any:
+        """Embed texts with the AI model.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            Matrix with one unit-length embedding per row
+        """
+        np = _import_numpy()
+        vectors = np.asarray(
+            self._get_generator().embed(
+                texts, self.config.get("embedding_model", "text-embedding-3-small")
+            ),
+            dtype=np.float32,
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _embed_missing(self, texts: List[str]) -> None:
+        """Embed the texts that have no vector yet, in bounded requests.
+
+        Vectors are stored as each request completes, so after a failure
+        only the remaining texts are sent again.
+
+        Args:
+            texts: The texts that need a vector
+        """
+        missing = [t for t in dict.fromkeys(texts) if t not in self._embeddings]
+        for start in range(0, len(missing), _EMBED_BATCH_SIZE):
+            batch = missing[start : start + _EMBED_BATCH_SIZE]
+            self._embeddings.update(zip(batch, self._embed(batch)))
+
+    def _update_semantic_index(self) -> None:
+        """Add library actions that are not in the similarity matrix yet."""
+        np = _import_numpy()
+        indexed = set(self._emb_actions)
+        new_actions = [a for a in self.keyword_library if a not in indexed]
+        if not new_actions:
+            return
+
+        # Library entries without a vector yet are embedded first
+        self._embed_missing(new_actions)
+
+        rows = np.stack([self._embeddings[a] for a in new_actions])
+        if self._emb_matrix is None:
+            self._emb_matrix = rows
+        else:
+            self._emb_matrix = np.vstack([self._emb_matrix, rows])
+        self._emb_actions.extend(new_actions)
+
+    def _semantic_lookup(
+        self, actions: List[str]
+    ) -> Dict[str, Tuple[Optional[str], float]]:
+        """Match actions to library entries for paraphrases of the same action.
+
+        Args:
+            actions: Actions that have no exact match in the library
+
+        Returns:
+            Dictionary mapping each action whose most similar library action
+            reaches the similarity threshold to that entry's
+            (keyword, confidence)
+        """
+        if not self._semantic or not actions:
+            return {}
+        # After a failure, matching is skipped until the retry time
+        if time.monotonic() < self._semantic_retry_at:
+            return {}
+
         try:
+            with self._lock:
+                self._update_semantic_index()
+                if self._emb_matrix is None:
+                    return {}
+                # Query vectors are kept, so mapped actions are indexed later
+                # without embedding them again
+                self._embed_missing(actions)
+            queries = _import_numpy().stack([self._embeddings[a] for a in actions])
+        except Exception as e:
+            delay = min(
+                _SEMANTIC_RETRY_DELAY * 2**self._semantic_failures,
+                _SEMANTIC_MAX_RETRY_DELAY,
+            )
+            self._semantic_failures += 1
+            self._semantic_retry_at = time.monotonic() + delay
+            print(
+                f"Warning: Semantic keyword matching failed, "
+                f"retrying in {delay:.0f}s: {e}"
+            )
+            return {}
+        self._semantic_failures = 0
+
+        matches: Dict[str, Tuple[Optional[str], float]] = {}
+        similarities = queries @ self._emb_matrix.T
+        best = similarities.argmax(axis=1)
+        for action, row, index in zip(actions, similarities, best):
+            if row[index] >= self._semantic_threshold:
+                entry = self.keyword_library[self._emb_actions[index]]
+                matches[action] = (entry["keyword"], entry["confidence"])
+        return matches
+
+    def _get_generator(self) -> TestGenerator:
+        """Get the AI test generator, creating and initializing it on first use.
+
+        Returns:
+            The initialized TestGenerator instance.
+        """
+        if self._generator is None:
             generator = TestGenerator(
                 model_name=self.config.get("model_name", "gpt-4"),
                 temperature=self.config.get("temperature", 0.7),
             )
-            generator.initialize()  # Ensure client is initialized
-
-            # Prepare the prompt with existing library
-            library_keywords = list(self.keyword_library.keys())
-            prompt = f"""
-            You are a Robot Framework test case generator.
-            Given the action: "{action}"
-            Suggest the most appropriate Robot Framework keyword.
-            Return a JSON object with the following structure:
-            {{"keyword": "KeywordName", "confidence": 0.0 to 1.0}}
-            """
+            generator.initialize()
+            self._generator = generator
+        return self._generator
+
+    def _get_cached_result(
+        self, action: str
+    ) -> Optional[Tuple[Optional[str], float]]:
+        """Get the remembered AI lookup result for an action.
+
+        Args:
+            action: The action extracted from documentation
+
+        Returns:
+            The cached (keyword, confidence) tuple, or None if not cached
+        """
+        with self._lock:
+            result = self._action_cache.get(action)
+            if result is not None:
+                self._action_cache.move_to_end(action)
+            return result
+
+    def _cache_result(
+        self, action: str, result: Tuple[Optional[str], float]
+    ) -> None:
+        """Remember an AI lookup result, evicting the least recently used one.
+
+        Args:
+            action: The action extracted from documentation
+            result: The (keyword, confidence) tuple returned for the action
+        """
+        with self._lock:
+            self._action_cache[action] = result
+            self._action_cache.move_to_end(action)
+            if len(self._action_cache) > _ACTION_CACHE_SIZE:
+                self._action_cache.popitem(last=False)
+
+    def _rule_lookup(self, action: str) -> Optional[Tuple[str, float]]:
+        """Map an action by its leading verb using the rule table.
+
+        Matches are not added to the library, so feedback for the action and
+        changes to the rule table take effect on the next lookup.
+
+        Args:
+            action: The action extracted from documentation
+
+        Returns:
+            Tuple containing (keyword, 1.0), or None if no rule matches
+        """
+        keyword = self._rule_table.get(_leading_verb(action))
+        if keyword is None:
+            return None
+        return keyword, 1.0
+
+    def map_action_to_keyword(self, action: str) -> Tuple[Optional[str], float]:
+        """Map an action to the most appropriate Robot Framework keyword.
+
+        Args:
+            action: The action extracted from documentation
+
+        Returns:
+            Tuple containing (keyword, confidence) or (None, 0) if no match
+        """
+        # Check if action is already in library
+        entry = self.keyword_library.get(action)
+        if entry is not None:
+            return entry["keyword"], entry["confidence"]
+
+        # Common verbs map straight to built-in keywords
+        result: Optional[Tuple[Optional[str], float]] = self._rule_lookup(action)
+        if result is not None:
+            return result
+
+        # Repeated misses are answered without asking the AI model again
+        result = self._get_cached_result(action)
+        if result is not None:
+            return result
+
+        # Paraphrases of a known action reuse its keyword
+        match = self._semantic_lookup([action]).get(action)
+        if match is not None:
+            return match
+
+        result = self._ai_lookup(action)
+        self._cache_result(action, result)
+        return result
+
+    def _ai_lookup(self, action: str) -> Tuple[Optional[str], float]:
+        """Ask the AI model for the keyword best matching an action.
+
+        Args:
+            action: The action extracted from documentation
+
+        Returns:
+            Tuple containing (keyword, confidence) or (None, 0) if no match
+        """
+        try:
+            generator = self._get_generator()
+
+            prompt = _KEYWORD_PROMPT_PREFIX + action + _KEYWORD_PROMPT_SUFFIX
 
             response = generator.generate_test_cases(prompt, "robot")
-            if response and isinstance(response, list) and len(response) > 0:
-                # Get the first response
-                first_response = response[0]
-                if isinstance(first_response, dict) and "content" in first_response:
-                    # Parse the JSON response
-                    try:
-                        result = json.loads(first_response["content"])
-                        if (
-                            isinstance(result, dict)
-                            and "keyword" in result
-                            and "confidence" in result
-                        ):
-                            suggested_keyword = result["keyword"].strip()
-                            confidence = float(result["confidence"])
-
-                            # Add to library with confidence score
-                            self.keyword_library[action] = {
-                                "keyword": suggested_keyword,
-                                "confidence": confidence,
-                            }
-                            if self._save_keyword_library():
-                                return suggested_keyword, confidence
-                            else:
-                                print(
-                                    f"Warning: Failed to save keyword mapping for action '{action}'"
-                                )
-                                return None, 0.0
-                    except (json.JSONDecodeError, ValueError):
-                        # If JSON parsing fails, fall back to simple text response
-                        suggested_keyword = first_response["content"].strip()
-                        confidence = (
-                            0.8  # Default confidence for AI-generated suggestions
-                        )
-
-                        self.keyword_library[action] = {
-                            "keyword": suggested_keyword,
-                            "confidence": confidence,
-                        }
-                        if self._save_keyword_library():
-                            return suggested_keyword, confidence
-                        else:
-                            print(
-                                f"Warning: Failed to save keyword mapping for action '{action}'"
-                            )
-                            return None, 0.0
+            if not response or not isinstance(response, list):
+                return None, 0.0
+
+            # Get the first response
+            first_response = response[0]
+            if not isinstance(first_response, dict) or "content" not in first_response:
+                return None, 0.0
 
+            content = first_response["content"]
+            try:
+                result = _parse_model_json(content)
+            except ValueError:
+                # Not structured at all, so take the text as the keyword
+                suggested_keyword = content.strip()
+                confidence = 0.8  # Default confidence for AI-generated suggestions
+            else:
+                if not (
+                    isinstance(result, dict)
+                    and "keyword" in result
+                    and "confidence" in result
+                ):
+                    return None, 0.0
+                suggested_keyword = result["keyword"].strip()
+                confidence = float(result["confidence"])
+
+            # Add to library with confidence score; the lock keeps other
+            # threads from iterating the library while it changes
+            with self._lock:
+                self.keyword_library[action] = {
+                    "keyword": suggested_keyword,
+                    "confidence": confidence,
+                }
+                saved = self._mark_dirty(action)
+            if saved:
+                return suggested_keyword, confidence
+            print(f"Warning: Failed to save keyword mapping for action '{action}'")
             return None, 0.0
 
         except Exception as e:
-            self.unmapped_keywords.add(action)
+            with self._lock:
+                self.unmapped_keywords.add(action)
             print(
                 f"Warning: Failed to generate keyword for action '{action}': {str(e)}"
             )
             return None, 0.0
 
-    def get_unmapped_keywords(self) -> Set[str]:
-        """Get set of unmapped keywords that need human review."""
-        return self.unmapped_keywords
+    def map_actions_to_keywords(
+        self, actions: Iterable[str]
+    ) -> Dict[str, Tuple[Optional[str], float]]:
+        """Map several actions to Robot Framework keywords with one AI request.
+
+        Actions already in the library are answered from it; the remaining
+        unique actions are sent to the AI model together in a single prompt.
+
+        Args:
+            actions: The actions extracted from documentation
+
+        Returns:
+            Dictionary mapping each action to (keyword, confidence), with
+            (None, 0) for actions that could not be mapped
+        """
+        results: Dict[str, Tuple[Optional[str], float]] = {}
+        missing: List[str] = []
+        library_get = self.keyword_library.get
+        for action in dict.fromkeys(actions):
+            entry = library_get(action)
+            if entry is not None:
+                results[action] = (entry["keyword"], entry["confidence"])
+                continue
+            cached = self._get_cached_result(action)
+            if cached is not None:
+                results[action] = cached
+            else:
+                missing.append(action)
+
+        # Common verbs map straight to built-in keywords
+        for action in missing:
+            rule_result = self._rule_lookup(action)
+            if rule_result is not None:
+                results[action] = rule_result
+        missing = [action for action in missing if action not in results]
+
+        matches = self._semantic_lookup(missing)
+        if matches:
+            results.update(matches)
+            missing = [action for action in missing if action not in matches]
+
+        if not missing:
+            return results
+
+        # Use AI to suggest keywords for all remaining actions at once
+        try:
+            numbered_actions = "\n".join(
+                f"{i}. {action}" for i, action in enumerate(missing, 1)
+            )
+            prompt = _BATCH_PROMPT_PREFIX + numbered_actions + _BATCH_PROMPT_SUFFIX
+
+            response = self._get_generator().generate_test_cases(prompt, "robot")
+            suggestions = _parse_model_json(response[0]["content"])
+            if not isinstance(suggestions, list):
+                raise ValueError("Expected a JSON array of keyword suggestions")
+        except Exception as e:
+            with self._lock:
+                self.unmapped_keywords.update(missing)
+            print(f"Warning: Failed to generate keywords for actions {missing}: {e}")
+            for action in missing:
+                results[action] = (None, 0.0)
+                self._cache_result(action, results[action])
+            return results
+
+        mapped: Dict[str, Tuple[Optional[str], float]] = {}
+        for action, suggestion in zip(missing, suggestions):
+            try:
+                keyword = suggestion["keyword"].strip()
+                confidence = float(suggestion["confidence"])
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            mapped[action] = (keyword, confidence)
+
+        # Other threads may be iterating the library, e.g. to index it
+        with self._lock:
+            for action, (keyword, confidence) in mapped.items():
+                self.keyword_library[action] = {
+                    "keyword": keyword,
+                    "confidence": confidence,
+                }
+            # Actions the model gave no usable suggestion for need human review
+            self.unmapped_keywords.update(a for a in missing if a not in mapped)
+
+        if mapped and not self._mark_dirty(*mapped):
+            print(f"Warning: Failed to save keyword mappings for {list(mapped)}")
+            mapped = {}
+
+        for action in missing:
+            results[action] = mapped.get(action, (None, 0.0))
+            self._cache_result(action, results[action])
+        return results
+
+    async def map_actions_to_keywords_async(
+        self, actions: Iterable[str], max_concurrency: int = 8
+    ) -> Dict[str, Tuple[Optional[str], float]]:
+        """Map several actions concurrently, with one AI request per action.
+
+        Prefer ``map_actions_to_keywords``, which needs a single request; this
+        suits workloads where per-action prompts are wanted. Library changes
+        are saved once, after all actions are mapped.
+
+        Args:
+            actions: The actions extracted from documentation
+            max_concurrency: Maximum number of AI requests in flight
+
+        Returns:
+            Dictionary mapping each action to (keyword, confidence), with
+            (None, 0) for actions that could not be mapped
+        """
+        # Imported here: asyncio is costly to import and only needed here
+        import asyncio
+
+        unique_actions = list(dict.fromkeys(actions))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def resolve(action: str) -> Tuple[Optional[str], float]:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    None, self.map_action_to_keyword, action
+                )
+
+        with self.batch_updates():
+            results = await asyncio.gather(*map(resolve, unique_actions))
+        return dict(zip(unique_actions, results))
+
+    def get_unmapped_keywords(self) -> FrozenSet[str]:
+        """Get a snapshot of unmapped keywords that need human review.
+
+        Returns:
+            An immutable copy, so later mapping calls don't change it
+        """
+        with self._lock:
+            return frozenset(self.unmapped_keywords)
 
     def add_feedback(self, action: str, keyword: str, confidence: float):
         """Add user feedback to improve keyword mapping.
@@ -175,10 +851,14 @@ class KeywordMapper:
             keyword: The correct keyword mapping
             confidence: User confidence in the mapping (0.0 to 1.0)
         """
-        self.keyword_library[action] = {"keyword": keyword, "confidence": confidence}
-        self._save_keyword_library()
-        if action in self.unmapped_keywords:
-            self.unmapped_keywords.remove(action)
+        with self._lock:
+            self.keyword_library[action] = {
+                "keyword": keyword,
+                "confidence": confidence,
+            }
+            self._action_cache.pop(action, None)
+            self._mark_dirty(action)
+            self.unmapped_keywords.discard(action)
 
     def generate_test_case(self, action: str) -> str:
         """Generate a test case line for the given action.
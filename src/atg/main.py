@@ -5,9 +5,10 @@ This module contains the main entry point for the ATG (Automated Test Generator)
 import argparse
 import json
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional, Sequence, Dict, Any
+from typing import Optional, Sequence, Dict, Any, List
 
 from atg.ai import TestGenerator
 from atg.config import config
@@ -216,19 +217,53 @@ def main(args: Optional[Sequence[str]] = None) -> int:
         elif parsed_args.source.is_dir():
             # Find all supported files in directory
             supported_extensions = [".py", ".md", ".txt", ".pdf", ".docx"]
-            for ext in supported_extensions:
-                for file_path in parsed_args.source.glob(f"**/*{ext}"):
-                    if not file_path.is_file():
-                        continue
+            files = [
+                file_path
+                for ext in supported_extensions
+                for file_path in parsed_args.source.glob(f"**/*{ext}")
+                if file_path.is_file()
+            ]
+
+            # Files with the same name write the same test file, so each
+            # group of them is processed in order, with the last one winning.
+            # Names are compared case-insensitively, since test_Spec.py and
+            # test_spec.py are the same file on Windows and macOS.
+            groups: Dict[str, List[Path]] = {}
+            for file_path in files:
+                groups.setdefault(file_path.stem.lower(), []).append(file_path)
+            for stem, group in groups.items():
+                if len(group) > 1:
+                    logger.warning(
+                        f"Files {', '.join(map(str, group))} all generate "
+                        f"test_{stem}.py; only tests for {group[-1]} are kept"
+                    )
 
-                    result = process_file(
+            def process_group(group: List[Path]) -> List[Dict[str, Any]]:
+                return [
+                    process_file(
                         file_path, parsed_args.output, generator, parsed_args.framework
                     )
-
-                    if result["status"] == "success":
-                        results["processed"].append(result)
-                    else:
-                        results["errors"].append(result)
+                    for file_path in group
+                ]
+
+            # Groups are independent and mostly wait on the AI service, so
+            # process them concurrently; results keep the file order
+            from concurrent.futures import ThreadPoolExecutor
+
+            file_results: Dict[Path, Dict[str, Any]] = {}
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for group, group_results in zip(
+                    groups.values(), executor.map(process_group, groups.values())
+                ):
+                    file_results.update(zip(group, group_results))
+
+            for file_path in files:
+                result = file_results[file_path]
+                if result["status"] == "success":
+                    results["processed"].append(result)
+                else:
+                    results["errors"].append(result)
 
         # Save results summary
         summary = {
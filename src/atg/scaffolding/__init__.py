@@ -4,15 +4,19 @@ This module provides functionality to generate test case templates and scaffoldi
 based on documentation and requirements.
 """
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, Any
 import os
 import json
+import re
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateNotFound
 
 from atg.config import Config
 from atg.keywords import KeywordMapper
 
+# Runs of characters other than letters, digits and underscores, in any script
+_SAFE_NAME_RE = re.compile(r"\W+")
+
 
 class TestCaseGenerator:
     """Generates test case scaffolding based on documentation and requirements."""
@@ -27,27 +31,31 @@ class TestCaseGenerator:
         self.config = config
         self.keyword_mapper = keyword_mapper or KeywordMapper(config)
         self.templates_dir = Path(__file__).parent / "templates"
-        self.templates = self._load_templates()
 
-    def _load_templates(self) -> Dict[str, str]:
-        """Load test case templates from the templates directory.
+    @property
+    def templates_dir(self) -> Path:
+        """Directory the Jinja2 templates are loaded from."""
+        return self._templates_dir
 
-        Returns:
-            Dictionary mapping template names to their content
-        """
-        templates = {}
-        if not self.templates_dir.exists():
-            self.templates_dir.mkdir(parents=True, exist_ok=True)
-            return templates
+    @templates_dir.setter
+    def templates_dir(self, templates_dir: Union[str, Path]) -> None:
+        """Set the templates directory and build the Jinja2 environment for it.
 
-        for template_file in self.templates_dir.glob("*.j2"):
-            try:
-                with open(template_file, "r", encoding="utf-8") as f:
-                    templates[template_file.stem] = f.read()
-            except Exception as e:
-                print(f"Warning: Failed to load template {template_file.name}: {e}")
+        The environment keeps every compiled template, so rendering only
+        parses each template file once, however many templates there are.
 
-        return templates
+        Args:
+            templates_dir: Directory containing the ``*.j2`` templates
+        """
+        self._templates_dir = Path(templates_dir)
+        self._env = Environment(
+            loader=FileSystemLoader(str(self._templates_dir)),
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=-1,
+        )
 
     def generate_test_case(
         self,
@@ -69,19 +77,117 @@ class TestCaseGenerator:
         Returns:
             Path to the generated test case file
         """
-        # Get the appropriate template for the framework
-        template = self.templates.get(f"test_case_{framework}")
-        if not template:
-            raise ValueError(f"No template found for framework: {framework}")
+        spec = {
+            "test_name": test_name,
+            "description": description,
+            "steps": steps,
+            "framework": framework,
+        }
+        return self.generate_test_cases_bulk([spec], output_dir)[0]
+
+    def generate_test_cases_bulk(
+        self,
+        specs: Iterable[Dict[str, Any]],
+        output_dir: Optional[Union[str, Path]] = None,
+    ) -> List[str]:
+        """Generate several test case files in one pass.
+
+        Keywords for the steps of all test cases are resolved together, and
+        every test case is rendered before any file is written. Test cases
+        whose names map to the same file get a numeric suffix (``_2``, ...),
+        so none of them overwrites another.
+
+        Args:
+            specs: Test cases, each a dictionary with 'test_name',
+                'description', 'steps' and optionally 'framework' (default
+                'robot'), as accepted by generate_test_case
+            output_dir: Directory to save the generated test cases
+
+        Returns:
+            Paths to the generated test case files, in the order of specs
+        """
+        specs = list(specs)
+
+        # Check that a template exists for each framework
+        for framework in {spec.get("framework", "robot") for spec in specs}:
+            try:
+                self._env.get_template(f"test_case_{framework}.j2")
+            except TemplateNotFound:
+                raise ValueError(f"No template found for framework: {framework}")
+
+        # Resolve keyword mappings for all steps at once, saving new
+        # mappings to the keyword library a single time
+        with self.keyword_mapper.batch_updates():
+            mappings = self.keyword_mapper.map_actions_to_keywords(
+                step.get("action", "") for spec in specs for step in spec["steps"]
+            )
+
+        # Determine output path
+        if not output_dir:
+            output_dir = Path.cwd() / "tests"
+        else:
+            output_dir = Path(output_dir)
+
+        # Render every test case first, then write them out together
+        outputs = []
+        used_paths: Set[Path] = set()
+        for spec in specs:
+            framework = spec.get("framework", "robot")
+            test_case = self._render_test_case(
+                spec["test_name"],
+                spec["description"],
+                spec["steps"],
+                framework,
+                mappings,
+            )
+            output_path = self._output_path(spec["test_name"], framework, output_dir)
+            if output_path in used_paths:
+                original = output_path
+                suffix = 2
+                while output_path in used_paths:
+                    output_path = original.with_name(
+                        f"{original.stem}_{suffix}{original.suffix}"
+                    )
+                    suffix += 1
+                print(
+                    f"Warning: Test case '{spec['test_name']}' would overwrite "
+                    f"{original.name}; writing {output_path.name} instead"
+                )
+            used_paths.add(output_path)
+            outputs.append((output_path, test_case))
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for output_path, test_case in outputs:
+            output_path.write_text(test_case, encoding="utf-8")
+
+        return [str(output_path) for output_path, _ in outputs]
+
+    def _render_test_case(
+        self,
+        test_name: str,
+        description: str,
+        steps: List[Dict[str, str]],
+        framework: str,
+        mappings: Dict[str, Tuple[Optional[str], float]],
+    ) -> str:
+        """Render a test case with its steps mapped to keywords.
 
+        Args:
+            test_name: Name of the test case
+            description: Test case description
+            steps: List of test steps, each with 'action' and 'expected_result'
+            framework: Test framework to use (e.g., 'robot', 'pytest')
+            mappings: Keyword mapping for each step action
+
+        Returns:
+            Rendered test case
+        """
         # Process steps to include keyword mappings
         processed_steps = []
         for step in steps:
             action = step.get("action", "")
             expected = step.get("expected_result", "")
-
-            # Get keyword mapping if available
-            keyword, confidence = self.keyword_mapper.map_action_to_keyword(action)
+            keyword, confidence = mappings[action]
 
             processed_steps.append(
                 {
@@ -93,34 +199,30 @@ class TestCaseGenerator:
             )
 
         # Render the template with the test case data
-        test_case = self._render_template(
+        return self._render_template(
             f"test_case_{framework}",
             test_name=test_name,
             description=description,
             steps=processed_steps,
         )
 
-        # Determine output path
-        if not output_dir:
-            output_dir = Path.cwd() / "tests"
-        else:
-            output_dir = Path(output_dir)
+    @staticmethod
+    def _output_path(test_name: str, framework: str, output_dir: Path) -> Path:
+        """Get the file a test case is written to.
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+        Args:
+            test_name: Name of the test case
+            framework: Test framework to use (e.g., 'robot', 'pytest')
+            output_dir: Directory to save the generated test case
 
+        Returns:
+            Path of the test case file
+        """
         # Generate filename based on test name
+        safe_name = _SAFE_NAME_RE.sub("_", test_name.lower()).strip("_") or "test_case"
         if framework == "robot":
-            filename = f"{test_name.lower().replace(' ', '_')}.robot"
-        else:
-            filename = f"test_{test_name.lower().replace(' ', '_')}.py"
-
-        output_path = output_dir / filename
-
-        # Write the test case to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(test_case)
-
-        return str(output_path)
+            return output_dir / f"{safe_name}.robot"
+        return output_dir / f"test_{safe_name}.py"
 
     def _render_template(self, template_name: str, **context: Any) -> str:
         """Render a template with the given context.
@@ -135,16 +237,8 @@ class TestCaseGenerator:
         Raises:
             ValueError: If the template is not found
         """
-        # Create Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            undefined=StrictUndefined,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
         try:
-            template = env.get_template(f"{template_name}.j2")
+            template = self._env.get_template(f"{template_name}.j2")
             return template.render(**context)
         except Exception as e:
             raise ValueError(f"Failed to render template {template_name}: {e}")
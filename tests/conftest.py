@@ -2,6 +2,18 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(autouse=True)
+def clear_openai_clients():
+    """Start every test without cached OpenAI clients."""
+    from atg import ai
+
+    ai._clients.clear()
+    yield
+    ai._clients.clear()
@@ -29,6 +29,48 @@ class TestTestGenerator:
         mock_openai.assert_called_once_with(api_key="test-api-key")
         assert generator._client == mock_client
 
+    @patch("openai.OpenAI")
+    def test_initialize_reuses_client(self, mock_openai):
+        """Test that generators share one client per API key."""
+        first = TestGenerator()
+        first.initialize(api_key="test-api-key")
+        second = TestGenerator()
+        second.initialize(api_key="test-api-key")
+        other = TestGenerator()
+        other.initialize(api_key="other-api-key")
+
+        assert first._client is second._client
+        assert mock_openai.call_count == 2
+
+    def test_generate_test_cases_with_client(self):
+        """Test generating test cases with an injected client."""
+        client = MagicMock()
+        client.chat.completions.create.return_value.choices = [
+            MagicMock(message=MagicMock(content="def test_injected(): pass"))
+        ]
+
+        generator = TestGenerator()
+        test_cases = generator.generate_test_cases("Requirements", client=client)
+
+        assert test_cases[0]["content"] == "def test_injected(): pass"
+        assert generator._client is None
+
+    def test_embed(self):
+        """Test computing embeddings with the generator's client."""
+        generator = TestGenerator()
+        generator._client = MagicMock()
+        generator._client.embeddings.create.return_value.data = [
+            MagicMock(embedding=[1.0, 0.0]),
+            MagicMock(embedding=[0.0, 1.0]),
+        ]
+
+        vectors = generator.embed(["first", "second"], model="embedding-model")
+
+        assert vectors == [[1.0, 0.0], [0.0, 1.0]]
+        generator._client.embeddings.create.assert_called_once_with(
+            model="embedding-model", input=["first", "second"]
+        )
+
     @patch("openai.OpenAI")
     def test_generate_test_cases(self, mock_openai):
         """Test generating test cases."""
@@ -103,6 +145,14 @@ class TestConfig:
         assert config.get("temperature") == 0.7
         assert config.get("test_framework") == "pytest"
 
+    def test_global_config_is_shared(self):
+        """Test that the lazily created global config is a single instance."""
+        import atg.config
+
+        assert atg.config.config is config
+        with pytest.raises(AttributeError):
+            atg.config.missing_setting
+
     def test_config_set_get(self):
         """Test setting and getting configuration values."""
         config.set("test_key", "test_value")
@@ -118,11 +168,22 @@ class TestConfig:
     )
     def test_load_from_env(self):
         """Test loading configuration from environment variables."""
-        config.load_from_env()
+        config.load_from_env(reload=True)
         assert config.get("openai_api_key") == "test-env-key"
         assert config.get("model_name") == "test-model"
         assert config.get("temperature") == 0.5
 
+    @patch.dict("os.environ", {"ATG_MODEL_NAME": "env-model"})
+    def test_load_from_env_uses_snapshot(self):
+        """Test that the environment is only re-read when reload is requested."""
+        config.set("model_name", "gpt-4")
+        config.load_from_env()
+        assert config.get("model_name") == "gpt-4"
+
+        config.load_from_env(reload=True)
+        assert config.get("model_name") == "env-model"
+        config.set("model_name", "gpt-4")
+
     def test_validate(self):
         """Test configuration validation."""
         # Test with no API key
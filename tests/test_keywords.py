@@ -1,8 +1,12 @@
 """Tests for the keyword mapping module."""
+import asyncio
 import json
 import os
+import sys
+import threading
+from contextlib import nullcontext
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -20,25 +24,22 @@ def test_keyword_mapper_initialization():
     assert isinstance(mapper.unmapped_keywords, set)
 
 
-def test_load_keyword_library_existing_file():
+def test_load_keyword_library_existing_file(tmp_path):
     """Test loading keyword library from existing file."""
     config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
 
-    # Create temporary directory and file
-    with TemporaryDirectory() as tmpdir:
-        config.set("keyword_library_path", os.path.join(tmpdir, "keywords.json"))
+    # Create test library file with correct structure
+    test_library = {"click button": {"keyword": "Click Button", "confidence": 1.0}}
+    with open(config.get("keyword_library_path"), "w") as f:
+        json.dump(test_library, f)
 
-        # Create test library file with correct structure
-        test_library = {"click button": {"keyword": "Click Button", "confidence": 1.0}}
-        with open(config.get("keyword_library_path"), "w") as f:
-            json.dump(test_library, f)
-
-        # Create mapper with fresh config
-        mapper = KeywordMapper(config)
-        assert mapper.keyword_library == test_library
+    # Create mapper with fresh config
+    mapper = KeywordMapper(config)
+    assert mapper.keyword_library == test_library
 
-        # Verify no additional mappings were added
-        assert len(mapper.keyword_library) == 1
+    # Verify no additional mappings were added
+    assert len(mapper.keyword_library) == 1
 
 
 def test_load_keyword_library_nonexistent_file():
@@ -53,34 +54,31 @@ def test_load_keyword_library_nonexistent_file():
     assert len(mapper.keyword_library) == 0
 
 
-def test_save_keyword_library():
+def test_save_keyword_library(tmp_path):
     """Test saving keyword library to file."""
     config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    mapper = KeywordMapper(config)
 
-    # Create temporary directory
-    with TemporaryDirectory() as tmpdir:
-        config.set("keyword_library_path", os.path.join(tmpdir, "keywords.json"))
-        mapper = KeywordMapper(config)
-
-        # Add some keywords
-        mapper.keyword_library["click button"] = {
-            "keyword": "Click Button",
-            "confidence": 1.0,
-        }
-        mapper._save_keyword_library()
+    # Add some keywords
+    mapper.keyword_library["click button"] = {
+        "keyword": "Click Button",
+        "confidence": 1.0,
+    }
+    mapper._save_keyword_library()
 
-        # Verify file was created and has correct content
-        assert os.path.exists(config.get("keyword_library_path"))
-        with open(config.get("keyword_library_path"), "r") as f:
-            saved_data = json.load(f)
-            assert saved_data == mapper.keyword_library
+    # Verify file was created and has correct content
+    assert os.path.exists(config.get("keyword_library_path"))
+    with open(config.get("keyword_library_path"), "r") as f:
+        saved_data = json.load(f)
+        assert saved_data == mapper.keyword_library
 
-        # Verify saved data matches expected structure
-        assert isinstance(saved_data, dict)
-        assert len(saved_data) == 1
-        assert "click button" in saved_data
-        assert saved_data["click button"]["keyword"] == "Click Button"
-        assert saved_data["click button"]["confidence"] == 1.0
+    # Verify saved data matches expected structure
+    assert isinstance(saved_data, dict)
+    assert len(saved_data) == 1
+    assert "click button" in saved_data
+    assert saved_data["click button"]["keyword"] == "Click Button"
+    assert saved_data["click button"]["confidence"] == 1.0
 
 
 @patch("openai.OpenAI")
@@ -90,16 +88,10 @@ def test_map_action_to_keyword(mock_openai):
     mock_client = mock_openai.return_value
     mock_chat = mock_client.chat.completions.create.return_value
     mock_chat.choices = [
-        type(
-            "obj",
-            (),
-            {
-                "message": type(
-                    "msg",
-                    (),
-                    {"content": '{"keyword": "Click Button", "confidence": 0.8}'},
-                )
-            },
+        SimpleNamespace(
+            message=SimpleNamespace(
+                content='{"keyword": "Click Button", "confidence": 0.8}'
+            )
         )
     ]
 
@@ -131,6 +123,474 @@ def test_map_action_to_keyword(mock_openai):
     assert mapper.keyword_library["type text"]["confidence"] == 0.8
 
 
+@patch("atg.keywords.TestGenerator")
+def test_map_action_to_keyword_reuses_generator(mock_generator_cls, tmp_path):
+    """Test that one initialized generator serves every lookup."""
+    generator = mock_generator_cls.return_value
+    generator.generate_test_cases.return_value = [
+        {"content": '{"keyword": "Input Text", "confidence": 0.9}'}
+    ]
+
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    config.set("disable_rule_table", True)
+    mapper = KeywordMapper(config)
+
+    assert mapper.map_action_to_keyword("type text") == ("Input Text", 0.9)
+    assert mapper.map_action_to_keyword("type password") == ("Input Text", 0.9)
+
+    mock_generator_cls.assert_called_once()
+    generator.initialize.assert_called_once()
+    assert generator.generate_test_cases.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (
+            '```json\n{"keyword": "Mouse Over", "confidence": 0.9}\n```',
+            ("Mouse Over", 0.9),
+        ),
+        ("{'keyword': 'Mouse Over', 'confidence': 0.7}", ("Mouse Over", 0.7)),
+        ("Mouse Over", ("Mouse Over", 0.8)),
+    ],
+)
+@patch("atg.keywords.TestGenerator")
+def test_map_action_to_keyword_lenient_parsing(
+    mock_generator_cls, tmp_path, content, expected
+):
+    """Test parsing fenced, Python-literal and plain-text responses."""
+    mock_generator_cls.return_value.generate_test_cases.return_value = [
+        {"content": content}
+    ]
+
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    mapper = KeywordMapper(config)
+
+    assert mapper.map_action_to_keyword("hover menu") == expected
+
+
+@patch("atg.keywords.TestGenerator")
+def test_batch_updates_saves_once(mock_generator_cls, tmp_path):
+    """Test that mappings made inside batch_updates are saved a single time."""
+    generator = mock_generator_cls.return_value
+    generator.generate_test_cases.return_value = [
+        {"content": '{"keyword": "Input Text", "confidence": 0.9}'}
+    ]
+
+    config = Config()
+    library_path = tmp_path / "keywords.json"
+    config.set("keyword_library_path", str(library_path))
+    mapper = KeywordMapper(config)
+
+    with patch.object(
+        mapper, "_save_keyword_library", wraps=mapper._save_keyword_library
+    ) as save:
+        with mapper.batch_updates():
+            mapper.map_action_to_keyword("type text")
+            mapper.map_action_to_keyword("type password")
+            mapper.add_feedback("open page", "Go To", 1.0)
+            assert not library_path.exists()
+
+        save.assert_called_once()
+
+    with open(library_path) as f:
+        assert set(json.load(f)) == {"type text", "type password", "open page"}
+
+
+@patch("atg.keywords.TestGenerator")
+def test_map_action_to_keyword_caches_misses(mock_generator_cls, tmp_path):
+    """Test that failed lookups are remembered until feedback is given."""
+    generator = mock_generator_cls.return_value
+    generator.generate_test_cases.side_effect = RuntimeError("API error")
+
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    mapper = KeywordMapper(config)
+
+    assert mapper.map_action_to_keyword("hover menu") == (None, 0.0)
+    assert mapper.map_action_to_keyword("hover menu") == (None, 0.0)
+    assert mapper.map_actions_to_keywords(["hover menu"]) == {
+        "hover menu": (None, 0.0)
+    }
+    assert generator.generate_test_cases.call_count == 1
+
+    mapper.add_feedback("hover menu", "Mouse Over", 1.0)
+    assert mapper.map_action_to_keyword("hover menu") == ("Mouse Over", 1.0)
+    assert "hover menu" not in mapper._action_cache
+
+
+@patch("atg.keywords.TestGenerator")
+def test_map_actions_to_keywords_async(mock_generator_cls, tmp_path):
+    """Test mapping actions concurrently with one request per action."""
+    generator = mock_generator_cls.return_value
+
+    def suggest(prompt, framework):
+        keyword = "Go To" if "open page" in prompt else "Input Text"
+        return [{"content": json.dumps({"keyword": keyword, "confidence": 0.9})}]
+
+    generator.generate_test_cases.side_effect = suggest
+
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    config.set("disable_rule_table", True)
+    mapper = KeywordMapper(config)
+
+    with patch.object(
+        mapper, "_save_keyword_library", wraps=mapper._save_keyword_library
+    ) as save:
+        results = asyncio.run(
+            mapper.map_actions_to_keywords_async(
+                ["type text", "open page", "type text"], max_concurrency=2
+            )
+        )
+        save.assert_called_once()
+
+    assert results == {
+        "type text": ("Input Text", 0.9),
+        "open page": ("Go To", 0.9),
+    }
+    assert generator.generate_test_cases.call_count == 2
+
+
+@patch("atg.keywords.TestGenerator")
+def test_semantic_cache_matches_paraphrases(mock_generator_cls, tmp_path):
+    """Test that paraphrased actions reuse the keyword of a known action."""
+    pytest.importorskip("numpy")
+    vectors = {
+        "click login button": [1.0, 0.0, 0.0],
+        "press the login button": [0.98, 0.1, 0.0],
+        "open settings": [0.0, 0.0, 1.0],
+    }
+    generator = mock_generator_cls.return_value
+    generator.embed.side_effect = lambda texts, model: [vectors[t] for t in texts]
+    generator.generate_test_cases.return_value = [
+        {"content": '{"keyword": "Go To", "confidence": 0.9}'}
+    ]
+
+    library_path = tmp_path / "keywords.json"
+    library_path.write_text(
+        json.dumps(
+            {"click login button": {"keyword": "Click Button", "confidence": 1.0}}
+        )
+    )
+    config = Config()
+    config.set("keyword_library_path", str(library_path))
+    config.set("semantic_cache", True)
+    config.set("disable_rule_table", True)
+    mapper = KeywordMapper(config)
+
+    assert mapper.map_action_to_keyword("press the login button") == (
+        "Click Button",
+        1.0,
+    )
+    generator.generate_test_cases.assert_not_called()
+
+    # Dissimilar actions still go to the AI model
+    assert mapper.map_action_to_keyword("open settings") == ("Go To", 0.9)
+    generator.generate_test_cases.assert_called_once()
+
+    # Embeddings are persisted next to the library and reused on load
+    assert (tmp_path / "keywords.embeddings.npz").exists()
+    generator.embed.reset_mock()
+    reloaded = KeywordMapper(config)
+    assert reloaded.map_actions_to_keywords(["press the login button"]) == {
+        "press the login button": ("Click Button", 1.0)
+    }
+    generator.embed.assert_called_once_with(
+        ["press the login button"], "text-embedding-3-small"
+    )
+
+
+@patch("atg.keywords._EMBED_BATCH_SIZE", 2)
+@patch("atg.keywords.TestGenerator")
+def test_semantic_cache_embeds_in_chunks_and_backs_off(mock_generator_cls, tmp_path):
+    """Test that the library is embedded in chunks and failures pause matching."""
+    pytest.importorskip("numpy")
+    vectors = {"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [0.0, 1.0], "q": [1.0, 0.0]}
+
+    def embed(texts, model):
+        if embed.fail and "c" in texts:
+            embed.fail = False
+            raise RuntimeError("Request too large")
+        return [vectors[t] for t in texts]
+
+    embed.fail = True
+    generator = mock_generator_cls.return_value
+    generator.embed.side_effect = embed
+
+    library_path = tmp_path / "keywords.json"
+    library_path.write_text(
+        json.dumps(
+            {action: {"keyword": action.upper(), "confidence": 1.0} for action in "abc"}
+        )
+    )
+    config = Config()
+    config.set("keyword_library_path", str(library_path))
+    config.set("semantic_cache", True)
+    mapper = KeywordMapper(config)
+
+    assert mapper._semantic_lookup(["q"]) == {}
+    # Until the retry time, matching is skipped without new requests
+    assert mapper._semantic_lookup(["q"]) == {}
+    assert generator.embed.call_count == 2
+
+    # Only the chunk that failed is sent again
+    mapper._semantic_retry_at = 0.0
+    assert mapper._semantic_lookup(["q"]) == {"q": ("A", 1.0)}
+    assert [call.args[0] for call in generator.embed.call_args_list] == [
+        ["a", "b"],
+        ["c"],
+        ["c"],
+        ["q"],
+    ]
+
+
+def test_semantic_cache_requires_numpy():
+    """Test that enabling the semantic cache without NumPy fails early."""
+    config = Config()
+    config.set("semantic_cache", True)
+    with patch.dict(sys.modules, {"numpy": None}):
+        with pytest.raises(ImportError, match="numpy"):
+            KeywordMapper(config)
+
+
+@patch("openai.OpenAI")
+def test_map_actions_to_keywords(mock_openai, tmp_path):
+    """Test mapping several actions with a single batched AI request."""
+    mock_client = mock_openai.return_value
+    mock_client.chat.completions.create.return_value.choices = [
+        MagicMock(
+            message=MagicMock(
+                content=json.dumps(
+                    [
+                        {"keyword": "Input Text", "confidence": 0.9},
+                        {"keyword": "Go To", "confidence": 0.7},
+                    ]
+                )
+            )
+        )
+    ]
+
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    config.set("disable_rule_table", True)
+    mapper = KeywordMapper(config)
+    mapper.keyword_library["click button"] = {
+        "keyword": "Click Button",
+        "confidence": 1.0,
+    }
+
+    results = mapper.map_actions_to_keywords(
+        ["click button", "type text", "open page", "type text"]
+    )
+
+    assert results == {
+        "click button": ("Click Button", 1.0),
+        "type text": ("Input Text", 0.9),
+        "open page": ("Go To", 0.7),
+    }
+    # Only the two unknown actions were sent, in one request
+    mock_client.chat.completions.create.assert_called_once()
+    prompt = mock_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+    assert "1. type text" in prompt
+    assert "2. open page" in prompt
+    assert "click button" not in prompt
+
+    with open(tmp_path / "keywords.json") as f:
+        assert json.load(f)["open page"] == {"keyword": "Go To", "confidence": 0.7}
+
+
+@patch("openai.OpenAI")
+def test_map_actions_to_keywords_invalid_response(mock_openai, tmp_path):
+    """Test that actions are reported as unmapped when the response is invalid."""
+    mock_client = mock_openai.return_value
+    mock_client.chat.completions.create.return_value.choices = [
+        MagicMock(message=MagicMock(content="not json"))
+    ]
+
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    config.set("disable_rule_table", True)
+    mapper = KeywordMapper(config)
+
+    results = mapper.map_actions_to_keywords(["type text", "open page"])
+
+    assert results == {"type text": (None, 0.0), "open page": (None, 0.0)}
+    assert mapper.get_unmapped_keywords() == {"type text", "open page"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_keyword_library_round_trip(tmp_path, use_orjson):
+    """Test saving and loading the library with and without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    library = {
+        "click button": {"keyword": "Click Button", "confidence": 1.0},
+        "type café": {"keyword": "Input Text", "confidence": 0.85},
+    }
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+
+    json_backend = nullcontext() if use_orjson else patch("atg.keywords.orjson", None)
+    with json_backend:
+        mapper = KeywordMapper(config)
+        mapper.keyword_library.update(library)
+        assert mapper._save_keyword_library()
+        assert KeywordMapper(config).keyword_library == library
+
+    # The file stays indented JSON readable by the standard library
+    text = (tmp_path / "keywords.json").read_text(encoding="utf-8")
+    assert json.loads(text) == library
+    assert '\n  "click button": {' in text
+
+
+def test_save_keyword_library_is_atomic(tmp_path):
+    """Test that a failed save leaves the previous library intact."""
+    library_path = tmp_path / "keywords.json"
+    config = Config()
+    config.set("keyword_library_path", str(library_path))
+    mapper = KeywordMapper(config)
+    mapper.add_feedback("click button", "Click Button", 1.0)
+
+    mapper.keyword_library["type text"] = {"keyword": "Input Text", "confidence": 0.9}
+    with patch("atg.keywords.os.fsync", side_effect=OSError("Disk full")):
+        assert mapper._save_keyword_library() is False
+
+    with open(library_path) as f:
+        assert json.load(f) == {
+            "click button": {"keyword": "Click Button", "confidence": 1.0}
+        }
+    assert os.listdir(tmp_path) == ["keywords.json"]
+
+    # A failed first save doesn't leave an empty library behind either
+    config.set("keyword_library_path", str(tmp_path / "new.json"))
+    mapper = KeywordMapper(config)
+    mapper.keyword_library["type text"] = {"keyword": "Input Text", "confidence": 0.9}
+    with patch("atg.keywords.os.fsync", side_effect=OSError("Disk full")):
+        assert mapper._save_keyword_library() is False
+    assert os.listdir(tmp_path) == ["keywords.json"]
+
+
+def test_sqlite_keyword_library(tmp_path):
+    """Test that a .db library path stores the library in SQLite."""
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.db"))
+    mapper = KeywordMapper(config)
+    assert mapper.keyword_library == {}
+
+    mapper.add_feedback("click button", "Click Button", 1.0)
+    mapper.add_feedback("type text", "Input Text", 0.9)
+    mapper.add_feedback("click button", "Click Element", 0.95)
+
+    reloaded = KeywordMapper(config)
+    assert reloaded.keyword_library == {
+        "click button": {"keyword": "Click Element", "confidence": 0.95},
+        "type text": {"keyword": "Input Text", "confidence": 0.9},
+    }
+    mapper.close()
+    reloaded.close()
+    assert mapper._db is None
+
+
+def test_sqlite_keyword_library_other_thread(tmp_path):
+    """Test that a SQLite library can be written from another thread."""
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.db"))
+    mapper = KeywordMapper(config)
+
+    thread = threading.Thread(
+        target=mapper.add_feedback, args=("click button", "Click Button", 1.0)
+    )
+    thread.start()
+    thread.join()
+    mapper.close()
+
+    reloaded = KeywordMapper(config)
+    assert reloaded.keyword_library == {
+        "click button": {"keyword": "Click Button", "confidence": 1.0}
+    }
+    reloaded.close()
+
+
+@patch("atg.keywords.TestGenerator")
+def test_rule_table(mock_generator_cls, tmp_path):
+    """Test that actions starting with a common verb skip the AI model."""
+    library_path = tmp_path / "keywords.json"
+    config = Config()
+    config.set("keyword_library_path", str(library_path))
+    config.set("keyword_rules", {"hover": "Mouse Over"})
+    mapper = KeywordMapper(config)
+
+    assert mapper.map_action_to_keyword("Click the login button") == (
+        "Click Element",
+        1.0,
+    )
+    assert mapper.map_actions_to_keywords(["hover menu", "navigate to home"]) == {
+        "hover menu": ("Mouse Over", 1.0),
+        "navigate to home": ("Go To", 1.0),
+    }
+    mock_generator_cls.assert_not_called()
+
+    # Rule matches are not saved, so feedback still takes precedence
+    assert mapper.keyword_library == {}
+    assert not library_path.exists()
+    mapper.add_feedback("hover menu", "Mouse Over Menu", 1.0)
+    assert mapper.map_action_to_keyword("hover menu") == ("Mouse Over Menu", 1.0)
+
+    # With the rule table disabled the AI model is asked instead
+    config.set("disable_rule_table", True)
+    mock_generator_cls.return_value.generate_test_cases.return_value = [
+        {"content": '{"keyword": "Click Button", "confidence": 0.9}'}
+    ]
+    mapper = KeywordMapper(config)
+    assert mapper.map_action_to_keyword("click submit") == ("Click Button", 0.9)
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        "Check that the error message is shown",
+        "Close the cookie banner",
+        "Enter the admin area",
+        "Type of account must be Premium",
+        "Open the settings menu",
+        "Select the Remember me checkbox",
+    ],
+)
+def test_rule_table_skips_ambiguous_verbs(tmp_path, action):
+    """Test that verbs with several possible keywords are left to the AI model."""
+    config = Config()
+    config.set("keyword_library_path", str(tmp_path / "keywords.json"))
+    mapper = KeywordMapper(config)
+
+    assert mapper._rule_lookup(action) is None
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file permissions")
+def test_save_keyword_library_keeps_file_mode(tmp_path):
+    """Test that saving the library atomically keeps its permissions."""
+    library_path = tmp_path / "keywords.json"
+    library_path.write_text("{}")
+    library_path.chmod(0o640)
+    config = Config()
+    config.set("keyword_library_path", str(library_path))
+    mapper = KeywordMapper(config)
+
+    mapper.add_feedback("type text", "Input Text", 0.9)
+    assert library_path.stat().st_mode & 0o777 == 0o640
+
+    # A new library gets the same permissions as any newly created file
+    new_path = tmp_path / "new.json"
+    config.set("keyword_library_path", str(new_path))
+    mapper = KeywordMapper(config)
+    mapper.add_feedback("type text", "Input Text", 0.9)
+    plain_path = tmp_path / "plain.json"
+    plain_path.write_text("{}")
+    assert new_path.stat().st_mode & 0o777 == plain_path.stat().st_mode & 0o777
+
+
 def test_get_unmapped_keywords():
     """Test getting unmapped keywords."""
     config = Config()
@@ -143,6 +603,20 @@ def test_get_unmapped_keywords():
     assert mapper.get_unmapped_keywords() == {"type text", "select dropdown"}
 
 
+def test_get_unmapped_keywords_returns_snapshot():
+    """Test that the returned keywords are not affected by later changes."""
+    config = Config()
+    mapper = KeywordMapper(config)
+    mapper.unmapped_keywords.add("type text")
+
+    unmapped = mapper.get_unmapped_keywords()
+    mapper.add_feedback("type text", "Input Text", 0.9)
+
+    assert isinstance(unmapped, frozenset)
+    assert unmapped == {"type text"}
+    assert mapper.get_unmapped_keywords() == frozenset()
+
+
 def test_add_feedback():
     """Test adding user feedback."""
     config = Config()
@@ -179,5 +653,5 @@ def test_generate_test_case():
     assert test_case == ""  # Empty string since confidence is below threshold
 
     # Test with no mapping
-    test_case = mapper.generate_test_case("select dropdown")
+    test_case = mapper.generate_test_case("hover dropdown")
     assert test_case == ""
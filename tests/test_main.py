@@ -1,5 +1,7 @@
 """Tests for the main module."""
+import json
 import logging
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -30,13 +32,14 @@ def test_setup_logging():
     """Test logging setup."""
     # Test with different verbosity levels
     # The formula in setup_logging is: level = max(3 - verbosity, 0) * 10
-    for verbosity, expected_level in [
-        (0, 30),  # 3 * 10 = 30 (WARNING)
-        (1, 20),  # 2 * 10 = 20 (INFO)
-        (2, 10),  # 1 * 10 = 10 (DEBUG)
-        (3, 0),  # 0 * 10 = 0 (NOTSET)
-    ]:
-        with patch("logging.basicConfig") as mock_basic_config:
+    with patch("logging.basicConfig") as mock_basic_config:
+        for verbosity, expected_level in [
+            (0, 30),  # 3 * 10 = 30 (WARNING)
+            (1, 20),  # 2 * 10 = 20 (INFO)
+            (2, 10),  # 1 * 10 = 10 (DEBUG)
+            (3, 0),  # 0 * 10 = 0 (NOTSET)
+        ]:
+            mock_basic_config.reset_mock()
             setup_logging(verbosity)
             mock_basic_config.assert_called_once()
             assert mock_basic_config.call_args[1]["level"] == expected_level
@@ -56,22 +59,18 @@ class TestMain:
         mock_setup_logging,
         mock_parse_args,
         caplog,
+        tmp_path,
     ):
         """Test successful execution of main."""
-        # Create a mock for the source path
-        mock_source = MagicMock(spec=Path)
-        mock_source.is_file.return_value = True
-        mock_source.is_dir.return_value = False
-        mock_source.__str__.return_value = "source.py"
-
-        # Create a mock for the output path
-        mock_output = MagicMock(spec=Path)
-        mock_output.__str__.return_value = "tests"
+        # Create a real source file and output directory path
+        source = tmp_path / "source.py"
+        source.write_text("")
+        output = tmp_path / "tests"
 
         # Setup mock args
         mock_args = MagicMock()
-        mock_args.source = mock_source
-        mock_args.output = mock_output
+        mock_args.source = source
+        mock_args.output = output
         mock_args.verbose = 0
         mock_args.quiet = False
         mock_args.model = "gpt-4"
@@ -97,31 +96,101 @@ class TestMain:
         # Verify results
         assert result == 0
         mock_setup_logging.assert_called_once_with(0)
-        mock_source.mkdir.assert_not_called()  # Should not create source dir
+        assert source.is_file()  # Source is left untouched
+        assert output.is_dir()
         mock_test_generator.assert_called_once_with(
             model_name=mock_args.model, temperature=mock_args.temperature
         )
         mock_generator_instance.initialize.assert_called_once()
         mock_process_file.assert_called_once_with(
-            mock_source, mock_output, mock_generator_instance, mock_args.framework
+            source, output, mock_generator_instance, mock_args.framework
         )
 
+    @patch("atg.main.TestGenerator")
+    @patch("atg.main.process_file")
+    def test_main_directory(self, mock_process_file, mock_test_generator, tmp_path):
+        """Test processing every supported file in a directory."""
+        source = tmp_path / "docs"
+        source.mkdir()
+        (source / "a.txt").write_text("A")
+        (source / "b.md").write_text("B")
+        (source / "ignored.csv").write_text("C")
+        output = tmp_path / "out"
+
+        mock_process_file.side_effect = lambda file_path, *args: {
+            "status": "success" if file_path.suffix == ".md" else "error",
+            "file": str(file_path),
+            "message": "Parse error",
+        }
+
+        result = main([str(source), "-o", str(output)])
+
+        # Any failed file makes the run fail
+        assert result == 1
+        processed = sorted(
+            call.args[0].name for call in mock_process_file.call_args_list
+        )
+        assert processed == ["a.txt", "b.md"]
+
+        summary = json.loads((output / "test_generation_summary.json").read_text())
+        assert summary["processed_files"] == [str(source / "b.md")]
+        assert summary["error_files"] == [
+            {"file": str(source / "a.txt"), "error": "Parse error"}
+        ]
+
+    @patch("atg.main.TestGenerator")
+    @patch("atg.main.process_file")
+    def test_main_directory_same_stem(
+        self, mock_process_file, mock_test_generator, tmp_path, caplog
+    ):
+        """Test that files generating the same test file are not run in parallel."""
+        source = tmp_path / "docs"
+        (source / "a").mkdir(parents=True)
+        (source / "b").mkdir()
+        (source / "c").mkdir()
+        (source / "a" / "spec.md").write_text("A")
+        (source / "b" / "spec.txt").write_text("B")
+        # Differs only in case, which is the same test file on Windows/macOS
+        (source / "c" / "Spec.md").write_text("C")
+        output = tmp_path / "out"
+
+        calls = []
+
+        def record_call(file_path, *args):
+            calls.append((file_path, threading.current_thread()))
+            return {"status": "success", "file": str(file_path)}
+
+        mock_process_file.side_effect = record_call
+
+        with caplog.at_level(logging.WARNING):
+            result = main([str(source), "-o", str(output)])
+
+        assert result == 0
+        # All files are processed one after the other, in discovery order
+        # (Markdown files first, then text files)
+        processed = [file_path for file_path, _ in calls]
+        assert sorted(processed[:2]) == [
+            source / "a" / "spec.md",
+            source / "c" / "Spec.md",
+        ]
+        assert processed[2:] == [source / "b" / "spec.txt"]
+        assert len({thread for _, thread in calls}) == 1
+        assert "all generate test_spec.py" in caplog.text
+        assert str(source / "c" / "Spec.md") in caplog.text
+
     @patch("atg.main.parse_args")
-    def test_main_source_not_found(self, mock_parse_args, caplog):
+    def test_main_source_not_found(self, mock_parse_args, caplog, tmp_path):
         """Test main when source file doesn't exist."""
-        # Setup mocks
-        source_path = Path("nonexistent.py")
+        # Setup mocks; the source file is never created
+        source_path = tmp_path / "nonexistent.py"
         mock_args = MagicMock()
         mock_args.source = source_path
         mock_args.verbose = 0
         mock_parse_args.return_value = mock_args
 
-        # Make the source path not exist
-        with patch.object(Path, "exists") as mock_exists:
-            mock_exists.return_value = False
-            # Run main
-            with caplog.at_level(logging.ERROR):
-                result = main([str(source_path)])
+        # Run main
+        with caplog.at_level(logging.ERROR):
+            result = main([str(source_path)])
 
         # Verify results
         assert result == 1
@@ -1,4 +1,10 @@
 """Tests for document parsers."""
+import os
+import subprocess
+import sys
+import zipfile
+
+import markdown
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,12 +16,72 @@ from atg.ingestion.parsers import (
     DocxParser,
     PdfParser,
     get_parser,
+    load_parser,
+    load_parser_class,
     PARSERS,
 )
 
 
+# A minimal PDF file with one empty page
+_MINIMAL_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj\n"
+    b"<< /Type /Catalog /Pages 2 0 R >>\n"
+    b"endobj\n"
+    b"2 0 obj\n"
+    b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>\n"
+    b"endobj\n"
+    b"3 0 obj\n"
+    b"<< /Type /Page /Parent 2 0 R /Resources << >> /MediaBox [0 0 612 792] >>\n"
+    b"endobj\n"
+    b"xref\n"
+    b"0 4\n"
+    b"0000000000 65535 f \n"
+    b"0000000009 00000 n \n"
+    b"0000000051 00000 n \n"
+    b"0000000100 00000 n \n"
+    b"trailer\n"
+    b"<< /Size 4 /Root 1 0 R >>\n"
+    b"startxref\n"
+    b"184\n"
+    b"%%EOF"
+)
+
+
+def make_text_pdf(page_texts: list) -> bytes:
+    """Build a minimal PDF with one line of text per page."""
+    page_count = len(page_texts)
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(page_count))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{obj}\nendobj\n".encode()
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    pdf += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF"
+    ).encode()
+    return pdf
+
+
 class TestBaseParser:
-    """Tests for the BaseParser protocol."""
+    """Tests for the BaseParser base class."""
 
     def test_base_parser_has_required_methods(self):
         """Test that BaseParser has the required methods."""
@@ -30,6 +96,18 @@ class TestBaseParser:
         assert hasattr(BaseParser, "parse")
         assert hasattr(BaseParser, "can_parse")
 
+    def test_base_parser_is_abstract(self):
+        """Test that parsers must implement the abstract methods."""
+        with pytest.raises(TypeError):
+            BaseParser()
+
+        class IncompleteParser(BaseParser):
+            SUPPORTED_FORMATS = (".x",)
+
+        with pytest.raises(TypeError):
+            IncompleteParser()
+        assert isinstance(TextParser(), BaseParser)
+
 
 class TestTextParser:
     """Tests for the TextParser class."""
@@ -42,6 +120,7 @@ class TestTextParser:
     def test_supported_formats(self, text_parser: TextParser):
         """Test supported formats."""
         assert text_parser.supported_formats() == (".txt",)
+        assert TextParser.SUPPORTED_FORMATS == (".txt",)
 
     def test_parse(self, text_parser: TextParser, tmp_path: Path):
         """Test parsing a text file."""
@@ -52,6 +131,18 @@ class TestTextParser:
         result = text_parser.parse(test_file)
         assert result == test_content
 
+    def test_parse_matches_text_mode_read(
+        self, text_parser: TextParser, tmp_path: Path
+    ):
+        """Test that decoding matches Path.read_text, including newlines."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes("caf\u00e9\r\nline two\rline three\n".encode())
+
+        assert text_parser.parse(test_file) == test_file.read_text(encoding="utf-8")
+
+        with patch("atg.ingestion.parsers.text_parser._MMAP_THRESHOLD", 1):
+            assert text_parser.parse(test_file) == "caf\u00e9\nline two\nline three\n"
+
     def test_can_parse(self, text_parser: TextParser, tmp_path: Path):
         """Test can_parse method."""
         txt_file = tmp_path / "test.txt"
@@ -75,24 +166,37 @@ class TestMarkdownParser:
         """Test supported formats."""
         assert set(markdown_parser.supported_formats()) == {".md", ".markdown"}
 
-    @patch("markdown.Markdown")
-    def test_parse(
-        self, mock_markdown, markdown_parser: MarkdownParser, tmp_path: Path
-    ):
+    def test_parse(self, markdown_parser: MarkdownParser, tmp_path: Path):
         """Test parsing a markdown file."""
         test_file = tmp_path / "test.md"
         test_content = "# Heading\n\nThis is a test."
         test_file.write_text(test_content)
 
-        # Mock the markdown conversion
-        mock_md_instance = MagicMock()
-        mock_md_instance.convert.return_value = "<h1>Heading</h1><p>This is a test.</p>"
-        mock_markdown.return_value = mock_md_instance
-
         result = markdown_parser.parse(test_file)
         assert "<h1>Heading</h1>" in result
         assert "<p>This is a test.</p>" in result
-        mock_md_instance.convert.assert_called_once_with(test_content)
+
+    def test_parse_reuses_converter(
+        self, markdown_parser: MarkdownParser, tmp_path: Path
+    ):
+        """Test that the cached converter does not leak state between files."""
+        first = tmp_path / "first.md"
+        first.write_text("[link][ref]\n\n[ref]: http://example.com")
+        second = tmp_path / "second.md"
+        second.write_text("[link][ref]")
+
+        with patch("markdown.Markdown", wraps=markdown.Markdown) as mock_markdown:
+            assert 'href="http://example.com"' in markdown_parser.parse(first)
+            assert "href" not in markdown_parser.parse(second)
+        assert mock_markdown.call_count <= 1
+
+    def test_parse_with_extensions(self, tmp_path: Path):
+        """Test that extensions can be enabled per parser."""
+        test_file = tmp_path / "table.md"
+        test_file.write_text("| a | b |\n|---|---|\n| 1 | 2 |\n")
+
+        assert "<table>" in MarkdownParser(extensions=["tables"]).parse(test_file)
+        assert "<table>" not in MarkdownParser().parse(test_file)
 
 
 class TestDocxParser:
@@ -125,6 +229,89 @@ class TestDocxParser:
         result = docx_parser.parse(test_file)
         assert "This is a test paragraph." in result
 
+    def test_parse_invalid_file(self, docx_parser: DocxParser, tmp_path: Path):
+        """Test error propagation for missing and corrupt files."""
+        from docx.opc.exceptions import PackageNotFoundError
+
+        with pytest.raises(PackageNotFoundError):
+            docx_parser.parse(tmp_path / "missing.docx")
+
+        test_file = tmp_path / "broken.docx"
+        with zipfile.ZipFile(test_file, "w") as package:
+            package.writestr("word/unrelated.xml", "<xml/>")
+        with pytest.raises(ValueError, match="Error parsing DOCX file") as exc_info:
+            docx_parser.parse(test_file)
+        assert exc_info.value.__cause__ is not None
+
+    def test_fast_path_matches_python_docx(self, tmp_path: Path):
+        """Test that the streaming XML path matches the python-docx output."""
+        import docx
+
+        from docx.enum.text import WD_BREAK
+        from docx.shared import Inches
+
+        document = docx.Document()
+        document.add_paragraph("First paragraph")
+        document.add_paragraph("")
+        document.add_paragraph("Second").add_run("\tparagraph")
+        paragraph = document.add_paragraph("Page")
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        paragraph.add_run("break")
+        paragraph = document.add_paragraph("Line")
+        paragraph.add_run().add_break(WD_BREAK.LINE)
+        paragraph.add_run("break")
+        paragraph = document.add_paragraph("Tab stop")
+        paragraph.paragraph_format.tab_stops.add_tab_stop(Inches(1))
+        table = document.add_table(rows=3, cols=3)
+        table.cell(0, 0).text = "a"
+        table.cell(1, 1).text = "b"
+        table.cell(0, 1).merge(table.cell(0, 2)).text = "wide"
+        table.cell(1, 0).merge(table.cell(2, 0)).text = "tall"
+        table.cell(2, 2).add_table(rows=1, cols=1).cell(0, 0).text = "nested"
+        section = document.sections[0]
+        section.header.paragraphs[0].text = "Header"
+        section.footer.paragraphs[0].text = "Footer"
+        section.different_first_page_header_footer = True
+        section.first_page_header.paragraphs[0].text = "First page header"
+        # The second section reuses the footer, the third its own header
+        document.add_section()
+        third = document.add_section()
+        third.header.is_linked_to_previous = False
+        third.header.paragraphs[0].text = "Third header"
+        test_file = tmp_path / "test.docx"
+        document.save(test_file)
+
+        fast = DocxParser()._parse_fast(test_file)
+        assert fast == DocxParser(fast=False).parse(test_file)
+        assert "First paragraph\n\nSecond\tparagraph" in fast
+        # Page breaks add no text, line breaks a newline
+        assert "Pagebreak\n\nLine\nbreak\n\nTab stop\n" in fast
+        # Merged cells repeat their text; nested tables are not cell text
+        assert "Tables:\na | wide | wide\ntall | b\ntall\n" in fast
+        assert "nested" not in fast
+        # Default headers and footers, once per section, like python-docx
+        assert fast.endswith(
+            "Headers/Footers:\nHeader\nFooter\nHeader\nFooter\nThird header\nFooter"
+        )
+
+    def test_fast_path_does_not_import_python_docx(self, tmp_path: Path):
+        """Test that python-docx is only imported for the fallback path."""
+        import docx
+
+        document = docx.Document()
+        document.add_paragraph("Hello")
+        test_file = tmp_path / "test.docx"
+        document.save(test_file)
+
+        code = (
+            "import sys\n"
+            "from atg.ingestion.parsers import DocxParser\n"
+            f"assert DocxParser().parse({str(test_file)!r}) == 'Hello'\n"
+            "assert 'docx' not in sys.modules\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
 
 class TestPdfParser:
     """Tests for the PdfParser class."""
@@ -142,38 +329,44 @@ class TestPdfParser:
         """Test parsing a PDF file with a minimal valid PDF."""
         # Create a minimal valid PDF file
         test_file = tmp_path / "test.pdf"
-
-        # This is a minimal PDF file with one empty page
-        minimal_pdf = (
-            b"%PDF-1.4\n"
-            b"1 0 obj\n"
-            b"<< /Type /Catalog /Pages 2 0 R >>\n"
-            b"endobj\n"
-            b"2 0 obj\n"
-            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>\n"
-            b"endobj\n"
-            b"3 0 obj\n"
-            b"<< /Type /Page /Parent 2 0 R /Resources << >> /MediaBox [0 0 612 792] >>\n"
-            b"endobj\n"
-            b"xref\n"
-            b"0 4\n"
-            b"0000000000 65535 f \n"
-            b"0000000009 00000 n \n"
-            b"0000000051 00000 n \n"
-            b"0000000100 00000 n \n"
-            b"trailer\n"
-            b"<< /Size 4 /Root 1 0 R >>\n"
-            b"startxref\n"
-            b"184\n"
-            b"%%EOF"
-        )
-
-        test_file.write_bytes(minimal_pdf)
+        test_file.write_bytes(_MINIMAL_PDF)
 
         # Test that parsing succeeds
         result = pdf_parser.parse(test_file)
         assert isinstance(result, str)
 
+    def test_parse_invalid_file(self, pdf_parser: PdfParser, tmp_path: Path):
+        """Test that parse errors are wrapped with the original as the cause."""
+        test_file = tmp_path / "broken.pdf"
+        test_file.write_bytes(b"not a pdf")
+
+        with pytest.raises(ValueError, match="Error parsing PDF file") as exc_info:
+            pdf_parser.parse(test_file)
+        assert exc_info.value.__cause__ is not None
+
+    def test_extract_metadata(self, pdf_parser: PdfParser):
+        """Test that only non-empty known metadata entries are included."""
+        pdf = MagicMock()
+        pdf.get_metadata_dict.return_value = {
+            "Keywords": "login",
+            "Title": "Spec",
+            "Author": "",
+            "Producer": "Writer",
+        }
+
+        assert pdf_parser._extract_metadata(pdf) == "Title: Spec\nKeywords: login"
+
+    def test_parse_multiple_pages_keeps_order(
+        self, pdf_parser: PdfParser, tmp_path: Path
+    ):
+        """Test that each page's text is extracted in page order."""
+        test_file = tmp_path / "pages.pdf"
+        test_file.write_bytes(make_text_pdf([f"Text {i}" for i in range(1, 12)]))
+
+        result = pdf_parser.parse(test_file)
+        expected = "\n\n".join(f"--- Page {i} ---\nText {i}" for i in range(1, 12))
+        assert result == expected
+
 
 def test_get_parser():
     """Test the get_parser function."""
@@ -183,6 +376,61 @@ def test_get_parser():
     assert isinstance(get_parser(Path("test.docx")), DocxParser)
     assert isinstance(get_parser(Path("test.pdf")), PdfParser)
 
+    # Test with string paths
+    assert isinstance(get_parser("notes.TXT"), TextParser)
+
+    # Parsers are shared per extension
+    assert get_parser("a.txt") is get_parser(Path("b.TXT")) is load_parser(".txt")
+
     # Test with unsupported format
     with pytest.raises(ValueError, match="No parser available for file type: .unknown"):
         get_parser(Path("test.unknown"))
+
+
+def test_ingestion_reexports_parser_registry():
+    """Test that atg.ingestion shares the parsers package registry."""
+    import atg.ingestion
+
+    assert atg.ingestion.PARSERS is PARSERS
+    assert atg.ingestion.get_parser is get_parser
+
+
+def test_parser_registry_resolves_lazily():
+    """Test that every registered extension resolves to a matching parser class."""
+    for ext in PARSERS:
+        parser_class = load_parser_class(ext)
+        assert ext in parser_class.SUPPORTED_FORMATS
+        # Resolved classes are cached
+        assert load_parser_class(ext) is parser_class
+
+    with pytest.raises(ValueError, match="No parser available for file type: .xyz"):
+        load_parser_class(".xyz")
+
+
+def test_get_parser_for_file():
+    """Test parser lookup for supported and unsupported files."""
+    from atg.ingestion import get_parser_for_file
+
+    assert isinstance(get_parser_for_file("README.MD"), MarkdownParser)
+    assert isinstance(get_parser_for_file(Path("docs/spec.pdf")), PdfParser)
+    assert get_parser_for_file("notes.unknown") is None
+    assert get_parser_for_file("Makefile") is None
+
+
+def test_parse_document(tmp_path: Path):
+    """Test parsing a document through the ingestion entry point."""
+    from atg.ingestion import parse_document
+
+    test_file = tmp_path / "notes.txt"
+    test_file.write_text("Some notes")
+
+    assert parse_document(test_file) == "Some notes"
+    assert parse_document(str(test_file)) == "Some notes"
+
+    with pytest.raises(FileNotFoundError):
+        parse_document(tmp_path / "missing.txt")
+
+    unsupported = tmp_path / "notes.unknown"
+    unsupported.touch()
+    with pytest.raises(ValueError, match="No parser available for file"):
+        parse_document(unsupported)
@@ -1,6 +1,5 @@
 """Tests for the test case scaffolding generator."""
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -23,11 +22,26 @@ def config():
 def keyword_mapper(config):
     """Create a mock keyword mapper."""
     mapper = KeywordMapper(config)
-    # Mock the map_action_to_keyword method
+    # Mock the keyword lookup methods
     mapper.map_action_to_keyword = MagicMock(return_value=("Click Element", 0.9))
+    mapper.map_actions_to_keywords = MagicMock(
+        side_effect=lambda actions: {
+            action: ("Click Element", 0.9) for action in actions
+        }
+    )
     return mapper
 
 
+@pytest.fixture
+def template_generator(config, keyword_mapper, tmp_path):
+    """Create a generator reading templates from an empty temporary directory."""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    generator = TestCaseGenerator(config, keyword_mapper)
+    generator.templates_dir = template_dir
+    return generator
+
+
 def test_test_case_generator_init(config, keyword_mapper):
     """Test TestCaseGenerator initialization."""
     # Test with default keyword mapper
@@ -40,28 +54,21 @@ def test_test_case_generator_init(config, keyword_mapper):
     assert generator.keyword_mapper == keyword_mapper
 
 
-def test_load_templates():
-    """Test template loading."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a test template
-        template_dir = Path(temp_dir) / "templates"
-        template_dir.mkdir()
+def test_templates_loaded_from_templates_dir(template_generator, tmp_path):
+    """Test that templates are looked up in the configured directory."""
+    generator = template_generator
+    (generator.templates_dir / "test_case_robot.j2").write_text("Test template content")
 
-        test_template = template_dir / "test_case_robot.j2"
-        test_template.write_text("Test template content")
+    assert generator._env.list_templates() == ["test_case_robot.j2"]
 
-        # Create generator with custom template directory
-        config = Config()
-        config.disable_validation()
-        generator = TestCaseGenerator(config)
-
-        # Replace templates_dir for testing
-        generator.templates_dir = template_dir
+    output_path = generator.generate_test_case(
+        "Login", "Login test", [], framework="robot", output_dir=tmp_path / "out"
+    )
+    assert Path(output_path).read_text() == "Test template content"
 
-        # Test template loading
-        templates = generator._load_templates()
-        assert "test_case_robot" in templates
-        assert templates["test_case_robot"] == "Test template content"
+    # Frameworks without a template are rejected
+    with pytest.raises(ValueError, match="No template found for framework: pytest"):
+        generator.generate_test_case("Login", "Login test", [], framework="pytest")
 
 
 def test_generate_test_case_robot(config, keyword_mapper, tmp_path):
@@ -115,6 +122,10 @@ def test_generate_test_case_robot(config, keyword_mapper, tmp_path):
         assert step["action"] not in content  # Should use mapped keywords instead
     assert "Click Element" in content  # From our mock
 
+    # All step actions are resolved with a single batched lookup
+    keyword_mapper.map_actions_to_keywords.assert_called_once()
+    keyword_mapper.map_action_to_keyword.assert_not_called()
+
 
 def test_generate_test_case_unsupported_framework(config, tmp_path):
     """Test error handling for unsupported test frameworks."""
@@ -172,3 +183,96 @@ def test_render_template(tmp_path):
     )
     assert "key=value" in result
     assert "foo=bar" in result
+
+
+def test_render_template_reuses_compiled_template(template_generator):
+    """Test that templates are loaded once and reused across renders."""
+    generator = template_generator
+    (generator.templates_dir / "greeting.j2").write_text("Hello {{ name }}!")
+
+    loader = generator._env.loader
+    with patch.object(loader, "get_source", wraps=loader.get_source) as get_source:
+        assert generator._render_template("greeting", name="A") == "Hello A!"
+        assert generator._render_template("greeting", name="B") == "Hello B!"
+        get_source.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "test_name, framework, filename",
+    [
+        ("Login / Logout: Admin?", "robot", "login_logout_admin.robot"),
+        ("  User Profile  ", "pytest", "test_user_profile.py"),
+        ("???", "robot", "test_case.robot"),
+        ("Prüfung Login", "robot", "prüfung_login.robot"),
+        ("Вход", "pytest", "test_вход.py"),
+    ],
+)
+def test_generate_test_case_sanitizes_filename(
+    template_generator, tmp_path, test_name, framework, filename
+):
+    """Test that test names are turned into safe file names."""
+    generator = template_generator
+    (generator.templates_dir / f"test_case_{framework}.j2").write_text(
+        "{{ test_name }}"
+    )
+
+    output_path = generator.generate_test_case(
+        test_name, "", [], framework=framework, output_dir=tmp_path / "out"
+    )
+
+    assert Path(output_path) == tmp_path / "out" / filename
+    assert Path(output_path).read_text() == test_name
+
+
+def test_generate_test_cases_bulk(template_generator, keyword_mapper, tmp_path):
+    """Test generating several test cases with one keyword lookup."""
+    generator = template_generator
+    (generator.templates_dir / "test_case_robot.j2").write_text(
+        "{{ test_name }}:{% for step in steps %} {{ step.keyword }}{% endfor %}"
+    )
+
+    output_paths = generator.generate_test_cases_bulk(
+        [
+            {"test_name": "Login", "description": "", "steps": [{"action": "a"}]},
+            {
+                "test_name": "Logout",
+                "description": "",
+                "steps": [{"action": "b"}, {"action": "a"}],
+            },
+        ],
+        output_dir=tmp_path / "out",
+    )
+
+    assert [Path(p).name for p in output_paths] == ["login.robot", "logout.robot"]
+    assert Path(output_paths[1]).read_text() == "Logout: Click Element Click Element"
+    keyword_mapper.map_actions_to_keywords.assert_called_once()
+
+
+def test_generate_test_cases_bulk_numbers_colliding_names(
+    template_generator, tmp_path, capsys
+):
+    """Test that test cases mapping to the same file don't overwrite each other."""
+    generator = template_generator
+    (generator.templates_dir / "test_case_robot.j2").write_text("{{ test_name }}")
+
+    output_paths = generator.generate_test_cases_bulk(
+        [
+            {"test_name": name, "description": "", "steps": []}
+            for name in ["Login", "login!", "LOGIN", "???"]
+        ],
+        output_dir=tmp_path / "out",
+    )
+
+    assert [Path(p).name for p in output_paths] == [
+        "login.robot",
+        "login_2.robot",
+        "login_3.robot",
+        "test_case.robot",
+    ]
+    assert [Path(p).read_text() for p in output_paths] == [
+        "Login",
+        "login!",
+        "LOGIN",
+        "???",
+    ]
+    assert "would overwrite login.robot" in capsys.readouterr().out